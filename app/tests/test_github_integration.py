@@ -93,19 +93,24 @@ This is a test {content_type}.
         assert syncer.dry_run is True
         assert syncer.project_root == Path.cwd()
 
-    @patch("subprocess.run")
-    def test_github_cli_command_execution(self, mock_subprocess):
+    def test_github_cli_command_execution(self):
         """Test GitHub CLI command execution with authentication."""
-        mock_subprocess.return_value = Mock(stdout="mock output", returncode=0)
+        calls = []
+
+        def fake_runner(cmd, **kwargs):
+            calls.append(cmd)
+            return Mock(stdout="mock output", stderr="", returncode=0)
 
-        syncer = StatusSyncer(self.repo_name, self.project_number, dry_run=False)
+        syncer = StatusSyncer(
+            self.repo_name, self.project_number, dry_run=False, runner=fake_runner
+        )
         result = syncer._run_gh_command(["api", "user"])
 
         assert result == "mock output"
-        mock_subprocess.assert_called_once()
+        assert len(calls) == 1
 
         # Verify gh command structure
-        call_args = mock_subprocess.call_args[0][0]
+        call_args = calls[0]
         assert call_args[0] == "gh"
         assert "api" in call_args
 
@@ -253,6 +258,95 @@ This is a test {content_type}.
         assert success is True
         assert test_file.read_text() == original_content
 
+    def test_sync_main_help_runs_in_process(self, capsys):
+        """Test the sync entry point parses arguments without a subprocess."""
+        with pytest.raises(SystemExit) as exc_info:
+            sync_module.main(["--help"])
+
+        assert exc_info.value.code == 0
+        assert "Sync GitHub Project status" in capsys.readouterr().out
+
+    def test_sync_main_requires_arguments(self, capsys):
+        """Test the sync entry point rejects a missing repository argument."""
+        with pytest.raises(SystemExit) as exc_info:
+            sync_module.main([])
+
+        assert exc_info.value.code == 2
+        assert "usage:" in capsys.readouterr().err
+
+    def test_sync_only_changed_planning_files(self):
+        """Test filenames passed by pre-commit restrict which items are synced."""
+        syncer = StatusSyncer(self.repo_name, self.project_number, dry_run=True)
+
+        item_ids = syncer._item_ids_from_filenames(
+            [
+                "planning/stories/S-001-test.md",
+                "planning/tasks/T-002-other.md",
+                "planning/README.md",
+            ]
+        )
+        assert item_ids == {"S-001", "T-002"}
+
+        syncer._get_project_items_with_status = Mock(
+            return_value=[
+                {"title": "S-001 Test", "status": "completed"},
+                {"title": "S-003 Untouched", "status": "completed"},
+            ]
+        )
+        syncer._update_one = Mock(return_value=True)
+
+        updated, errors = syncer.sync_status_to_files({"S-001"})
+
+        assert (updated, errors) == (1, 0)
+        synced_item = syncer._update_one.call_args[0][0]
+        assert synced_item["title"] == "S-001 Test"
+
+    def test_project_status_cached_between_runs(self, tmp_path):
+        """Test a fresh cached API response skips the GitHub CLI call."""
+        response = json.dumps(
+            {"data": {"user": {"projectV2": {"items": {"nodes": []}}}}}
+        )
+        syncer = StatusSyncer(self.repo_name, self.project_number)
+        syncer.cache_dir = tmp_path
+        syncer._run_gh_command = Mock(return_value=response)
+
+        syncer._get_project_items_with_status()
+        syncer._get_project_items_with_status()
+        assert syncer._run_gh_command.call_count == 1
+
+        syncer.use_cache = False
+        syncer._get_project_items_with_status()
+        assert syncer._run_gh_command.call_count == 2
+
+    def test_unchanged_status_leaves_file_untouched(self, tmp_path):
+        """Test a file already carrying the project status is not rewritten."""
+        syncer = StatusSyncer(self.repo_name, self.project_number)
+        test_file = tmp_path / "S-001-test.md"
+        original_content = "```yaml\nstatus: completed\n```\n\n# S-001\n"
+        test_file.write_text(original_content)
+
+        assert syncer._update_file_status(test_file, "completed") is None
+        assert test_file.read_text() == original_content
+
+        assert syncer._update_file_status(test_file, "review") is True
+        assert "status: review" in test_file.read_text()
+
+    def test_frontmatter_check_runs_without_github(self, tmp_path):
+        """Test the pre-commit check flags malformed frontmatter offline."""
+        syncer = StatusSyncer(self.repo_name, self.project_number)
+        syncer._run_gh_command = Mock()
+
+        valid_file = tmp_path / "S-001-valid.md"
+        valid_file.write_text("```yaml\nstatus: todo\n```\n\n# S-001\n")
+        plain_file = tmp_path / "T-002-plain.md"
+        plain_file.write_text("# T-002\n")
+        broken_file = tmp_path / "S-003-broken.md"
+        broken_file.write_text("```yaml\nstatus: todo\n\n# S-003\n")
+
+        assert syncer.check_frontmatter([str(valid_file), str(plain_file)]) == 0
+        assert syncer.check_frontmatter([str(valid_file), str(broken_file)]) == 1
+        syncer._run_gh_command.assert_not_called()
+
 
 class TestPlanningImporter:
     """Test importing planning files to GitHub issues."""
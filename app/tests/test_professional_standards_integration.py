@@ -9,7 +9,9 @@ import sys
 from pathlib import Path
 
 # Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "scripts"))
+scripts_path = str(Path(__file__).parent.parent.parent / "scripts")
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
 
 import importlib.util
 
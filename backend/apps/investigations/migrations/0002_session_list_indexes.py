@@ -0,0 +1,26 @@
+# Generated by Django 5.2.18 on 2026-10-17 02:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("investigations", "0001_initial"),
+        ("subjects", "__first__"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["subject", "status", "-created_at"],
+                name="sess_subj_stat_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(
+                fields=["status", "-created_at"], name="sess_stat_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+"""
+JSON renderers for Investigation Session API endpoints.
+Uses orjson for encoding when it is installed.
+"""
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson when available.
+
+    Falls back to DRF's standard rendering when orjson is not installed or
+    the client asks for indented output.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render data to JSON bytes."""
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # DRF's encoder handles lazy strings, Decimals and other extras, and
+        # formats datetimes the same way the stdlib renderer does
+        return orjson.dumps(
+            data,
+            default=self.encoder_class().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+        )
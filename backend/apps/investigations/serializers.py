@@ -11,7 +11,11 @@ from apps.subjects.models import Subject
 class SessionSerializer(serializers.ModelSerializer):
     """Serializer for Session model with full details."""
 
-    subject = serializers.PrimaryKeyRelatedField(queryset=Subject.objects.all())
+    # Write validation only needs to confirm the subject exists; name stays
+    # loaded for Session.__str__
+    subject = serializers.PrimaryKeyRelatedField(
+        queryset=Subject.objects.only("id", "name")
+    )
 
     class Meta:
         model = Session
@@ -113,6 +117,10 @@ class SessionCreateSerializer(serializers.ModelSerializer):
         subject = self.context["subject"]
         return Session.objects.create(subject=subject, **validated_data)
 
+    def to_representation(self, instance):
+        """Represent the created session with the full session details."""
+        return SessionSerializer(context=self.context).to_representation(instance)
+
 
 class SessionStatusUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating session status only."""
@@ -5,7 +5,10 @@ Following TDD approach - tests written first, then implementation.
 
 import json
 import uuid
+from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
@@ -15,9 +18,10 @@ from apps.subjects.models import Subject
 class SessionModelTests(TestCase):
     """Test cases for Session model functionality."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.subject = Subject.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.subject = Subject.objects.create(
             name="Test Subject", description="A test subject for session testing"
         )
 
@@ -73,16 +77,84 @@ class SessionModelTests(TestCase):
         session.refresh_from_db()
         self.assertEqual(session.status, "running")
 
+    def test_status_transition_validated_without_refetch(self):
+        """Test that saving a loaded session does not re-read its status."""
+        from apps.investigations.models import Session
+
+        created = Session.objects.create(
+            subject=self.subject, config_json={"search_engines": ["google"]}
+        )
+        session = Session.objects.get(pk=created.pk)
+        session.status = "running"
+
+        # A single UPDATE; no SELECT of the old row or the subject
+        with self.assertNumQueries(1):
+            session.save()
+
+    def test_invalid_status_transition_rejected(self):
+        """Test that terminal sessions cannot be moved back to running."""
+        from apps.investigations.models import Session
+
+        session = Session.objects.create(
+            subject=self.subject,
+            status="completed",
+            config_json={"search_engines": ["google"]},
+        )
+        session = Session.objects.get(pk=session.pk)
+        session.status = "running"
+
+        with self.assertRaises(ValidationError):
+            session.save()
+
+    def test_partial_save_keeps_status_snapshot(self):
+        """Test update_fields without status doesn't move the baseline."""
+        from apps.investigations.models import Session
+
+        created = Session.objects.create(
+            subject=self.subject,
+            status="running",
+            config_json={"search_engines": ["google"]},
+        )
+        session = Session.objects.get(pk=created.pk)
+
+        # The unsaved "completed" must not become the transition baseline
+        session.status = "completed"
+        session.config_json = {"search_engines": ["bing"]}
+        session.save(update_fields=["config_json"])
+
+        session.status = "paused"
+        session.save()
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, "paused")
+
 
 class SessionAPITests(APITestCase):
     """Test cases for Session API endpoints."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.subject = Subject.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data shared by every test in the class."""
+        cls.subject = Subject.objects.create(
             name="API Test Subject", description="Subject for API testing"
         )
 
+    @classmethod
+    def make_sessions(cls, n, **overrides):
+        """Insert n sessions for the test subject in a single query."""
+        from apps.investigations.models import Session
+
+        return Session.objects.bulk_create(
+            [
+                Session(
+                    subject=cls.subject,
+                    config_json={"search_engines": ["google"]},
+                    **overrides,
+                )
+                for _ in range(n)
+            ]
+        )
+
     def test_create_session_success(self):
         """Test POST /subjects/{subject_id}/sessions creates session successfully."""
         url = reverse("subject-sessions", args=[self.subject.id])
@@ -102,6 +174,17 @@ class SessionAPITests(APITestCase):
         self.assertEqual(str(response.data["subject"]), str(self.subject.id))
         self.assertEqual(response.data["status"], "created")
 
+    def test_create_session_looks_up_subject_once(self):
+        """Test creating a session fetches the subject a single time."""
+        url = reverse("subject-sessions", args=[self.subject.id])
+        data = {"config_json": {"search_engines": ["google"]}}
+
+        # One query for the subject, one to insert the session
+        with self.assertNumQueries(2):
+            response = self.client.post(url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
     def test_create_session_with_invalid_subject_returns_404(self):
         """Test creating session with non-existent subject returns 404."""
         invalid_subject_id = uuid.uuid4()
@@ -128,6 +211,19 @@ class SessionAPITests(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["id"], str(session.id))
 
+    def test_get_sessions_for_subject_query_count(self):
+        """Test listing sessions does not issue a query per session."""
+        self.make_sessions(3)
+
+        url = reverse("subject-sessions", args=[self.subject.id])
+
+        # One query for the subject, one for its sessions
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
     def test_update_session_status(self):
         """Test PUT /sessions/{id}/status updates session status."""
         from apps.investigations.models import Session
@@ -145,6 +241,144 @@ class SessionAPITests(APITestCase):
         session.refresh_from_db()
         self.assertEqual(session.status, "running")
 
+    def test_session_actions_with_unknown_session_return_404(self):
+        """Test status, start and complete return 404 for a missing session."""
+        missing_id = uuid.uuid4()
+
+        response = self.client.put(
+            reverse("session-status", args=[missing_id]),
+            {"status": "running"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        for name in ("session-start", "session-complete"):
+            response = self.client.post(reverse(name, args=[missing_id]))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertIn("detail", response.data)
+
+    def test_start_and_complete_update_only_changed_columns(self):
+        """Test start/complete write status and timestamps, not config_json."""
+        from apps.investigations.models import Session
+
+        session = Session.objects.create(
+            subject=self.subject, config_json={"search_engines": ["google"]}
+        )
+
+        for name, timestamp_column in (
+            ("session-start", "started_at"),
+            ("session-complete", "finished_at"),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(reverse(name, args=[session.id]))
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            updates = [
+                query["sql"]
+                for query in queries.captured_queries
+                if query["sql"].startswith("UPDATE")
+            ]
+            self.assertEqual(len(updates), 1)
+            self.assertIn(timestamp_column, updates[0])
+            self.assertNotIn("config_json", updates[0])
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, "completed")
+        self.assertIsNotNone(session.started_at)
+        self.assertIsNotNone(session.finished_at)
+
+    def test_transition_session_enforces_model_rules(self):
+        """Test transition_session refuses pairs the model forbids."""
+        from apps.investigations.views import transition_session
+
+        (session,) = self.make_sessions(1, status="completed")
+
+        session, changed = transition_session(
+            session.id, {"completed"}, "running", "started_at"
+        )
+
+        self.assertFalse(changed)
+        self.assertEqual(session.status, "completed")
+        self.assertIsNone(session.started_at)
+
+    def test_complete_paused_session_is_rejected(self):
+        """Test complete follows the model's rules, which require running."""
+        (session,) = self.make_sessions(1, status="paused")
+
+        response = self.client.post(reverse("session-complete", args=[session.id]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        session.refresh_from_db()
+        self.assertEqual(session.status, "paused")
+        self.assertIsNone(session.finished_at)
+
+    def test_start_session_twice_is_rejected(self):
+        """Test a second start fails its status guard and leaves the session."""
+        (session,) = self.make_sessions(1)
+        url = reverse("session-start", args=[session.id])
+
+        first = self.client.post(url)
+        started_at = first.data["started_at"]
+        second = self.client.post(url)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("running", second.data["error"])
+
+        detail = self.client.get(reverse("session-detail", args=[session.id]))
+        self.assertEqual(detail.data["started_at"], started_at)
+
+    def test_delete_session_skips_config_json(self):
+        """Test DELETE /sessions/{id} removes the session without loading config."""
+        from apps.investigations.models import Session
+
+        (session,) = self.make_sessions(1)
+        url = reverse("session-detail", args=[session.id])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.delete(url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Session.objects.filter(id=session.id).exists())
+        selects = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("SELECT")
+        ]
+        self.assertNotIn("config_json", selects[0])
+
+    def test_list_sessions_by_status_is_paginated(self):
+        """Test GET /sessions?status= pages results and skips config_json."""
+        self.make_sessions(3)
+        self.make_sessions(1, status="running")
+
+        url = reverse("sessions-list")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, {"status": "created", "limit": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+        for query in queries.captured_queries:
+            self.assertNotIn("config_json", query["sql"])
+
+    def test_sessions_by_status_query_count(self):
+        """Test listing sessions by status costs the same for 1 or 10 sessions."""
+        url = reverse("sessions-list")
+        self.make_sessions(1)
+
+        # One COUNT for pagination, one SELECT for the page
+        with self.assertNumQueries(2):
+            self.client.get(url, {"status": "created"})
+
+        self.make_sessions(9)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, {"status": "created"})
+
+        self.assertEqual(response.data["count"], 10)
+
     def test_create_session_with_valid_config_stores_json(self):
         """Test that session configuration is properly stored and validated."""
         url = reverse("subject-sessions", args=[self.subject.id])
@@ -175,17 +409,43 @@ class SessionAPITests(APITestCase):
 
         session_id = create_response.data["id"]
 
-        # Start session (change to running)
+        # Start session (change to running): one lookup, one update
         status_url = reverse("session-status", args=[session_id])
-        self.client.put(status_url, {"status": "running"}, format="json")
+        with self.assertNumQueries(2):
+            self.client.put(status_url, {"status": "running"}, format="json")
 
         # Complete session
-        self.client.put(status_url, {"status": "completed"}, format="json")
+        with self.assertNumQueries(2):
+            self.client.put(status_url, {"status": "completed"}, format="json")
 
-        # Get session details
+        # Get session details in a single query
         detail_url = reverse("session-detail", args=[session_id])
-        detail_response = self.client.get(detail_url)
+        with self.assertNumQueries(1):
+            detail_response = self.client.get(detail_url)
 
         self.assertEqual(detail_response.status_code, status.HTTP_200_OK)
         self.assertEqual(detail_response.data["status"], "completed")
         self.assertIsNotNone(detail_response.data["finished_at"])
+
+
+class ORJSONRendererTests(TestCase):
+    """Test cases for the Session API JSON renderer."""
+
+    def test_renders_same_json_as_drf_renderer(self):
+        """Test output decodes to the same data as DRF's JSONRenderer."""
+        from decimal import Decimal
+        from django.utils import timezone
+        from rest_framework.renderers import JSONRenderer
+        from apps.investigations.renderers import ORJSONRenderer
+
+        data = {
+            "id": uuid.uuid4(),
+            "created_at": timezone.now(),
+            "score": Decimal("1.50"),
+            "config_json": {"search_engines": ["google"], "nested": {"a": [1, 2]}},
+        }
+
+        rendered = ORJSONRenderer().render(data)
+
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data)))
+        self.assertEqual(ORJSONRenderer().render(None), b"")
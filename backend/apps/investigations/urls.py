@@ -24,11 +24,15 @@ urlpatterns = [
     ),
     # Convenience endpoints
     path(
-        "sessions/<uuid:session_id>/start/", views.start_session, name="session-start"
+        "sessions/<uuid:session_id>/start/",
+        views.SessionTransitionView.as_view(),
+        {"action": "start"},
+        name="session-start",
     ),
     path(
         "sessions/<uuid:session_id>/complete/",
-        views.complete_session,
+        views.SessionTransitionView.as_view(),
+        {"action": "complete"},
         name="session-complete",
     ),
     # Session filtering
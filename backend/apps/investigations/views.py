@@ -3,13 +3,19 @@ API views for Investigation Session management.
 Provides REST endpoints for session CRUD operations.
 """
 
+import functools
+
 from rest_framework import status, generics
 from rest_framework.response import Response
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, renderer_classes
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django.http import Http404
 
-from .models import Session
+from .models import VALID_STATUS_TRANSITIONS, Session, SessionStatus
+from .renderers import ORJSONRenderer
 from .serializers import (
     SessionSerializer,
     SessionCreateSerializer,
@@ -19,6 +25,29 @@ from .serializers import (
 from apps.subjects.models import Subject
 
 
+class SessionPagination(PageNumberPagination):
+    """Pagination for session list views."""
+
+    page_size = 20
+    page_size_query_param = "limit"
+    max_page_size = 100
+
+
+def with_session(view):
+    """
+    Resolve the session_id URL argument to a Session, or raise 404.
+
+    Apply below @api_view so DRF renders the 404 for missing sessions.
+    """
+
+    @functools.wraps(view)
+    def wrapper(request, session_id, *args, **kwargs):
+        session = get_object_or_404(Session, id=session_id)
+        return view(request, session, *args, **kwargs)
+
+    return wrapper
+
+
 class SubjectSessionListCreateView(generics.ListCreateAPIView):
     """
     List sessions for a subject or create a new session.
@@ -27,10 +56,14 @@ class SubjectSessionListCreateView(generics.ListCreateAPIView):
     POST /subjects/{subject_id}/sessions - Create new session for subject
     """
 
+    renderer_classes = [ORJSONRenderer]
+
     def get_subject(self):
-        """Get subject or raise 404."""
-        subject_id = self.kwargs["subject_id"]
-        return get_object_or_404(Subject, id=subject_id)
+        """Get subject or raise 404, looking it up once per request."""
+        if not hasattr(self, "_subject"):
+            subject_id = self.kwargs["subject_id"]
+            self._subject = get_object_or_404(Subject, id=subject_id)
+        return self._subject
 
     def get_queryset(self):
         """Get sessions for the specific subject."""
@@ -52,14 +85,13 @@ class SubjectSessionListCreateView(generics.ListCreateAPIView):
 
     def create(self, request, *args, **kwargs):
         """Create a new session for the subject."""
-        subject = self.get_subject()
+        # Resolves the subject (or 404s) via get_serializer_context
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        session = serializer.save()
+        serializer.save()
 
-        # Return full session details
-        response_serializer = SessionSerializer(session)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        # SessionCreateSerializer represents the session with full details
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
 class SessionDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -72,24 +104,26 @@ class SessionDetailView(generics.RetrieveUpdateDestroyAPIView):
     """
 
     queryset = Session.objects.all()
+    renderer_classes = [ORJSONRenderer]
     serializer_class = SessionSerializer
     lookup_field = "id"
 
+    def get_queryset(self):
+        """Load only the primary key for deletes, which echo no body."""
+        if self.request.method == "DELETE":
+            return Session.objects.only("id")
+        return super().get_queryset()
+
 
 @api_view(["PUT"])
-def update_session_status(request, session_id):
+@renderer_classes([ORJSONRenderer])
+@with_session
+def update_session_status(request, session):
     """
     Update session status only.
 
     PUT /sessions/{id}/status - Update session status
     """
-    try:
-        session = Session.objects.get(id=session_id)
-    except Session.DoesNotExist:
-        return Response(
-            {"error": "Session not found"}, status=status.HTTP_404_NOT_FOUND
-        )
-
     serializer = SessionStatusUpdateSerializer(session, data=request.data, partial=True)
     if serializer.is_valid():
         serializer.save()
@@ -112,10 +146,13 @@ class SessionsByStatusView(generics.ListAPIView):
     """
 
     serializer_class = SessionListSerializer
+    pagination_class = SessionPagination
+    renderer_classes = [ORJSONRenderer]
 
     def get_queryset(self):
         """Filter sessions by status query parameter."""
-        queryset = Session.objects.all()
+        # Load only the listed columns; config_json can be large
+        queryset = Session.objects.only(*SessionListSerializer.Meta.fields)
         status_filter = self.request.query_params.get("status", None)
 
         if status_filter:
@@ -124,55 +161,72 @@ class SessionsByStatusView(generics.ListAPIView):
         return queryset.order_by("-created_at")
 
 
-@api_view(["POST"])
-def start_session(request, session_id):
-    """
-    Convenience endpoint to start a session (set status to running).
-
-    POST /sessions/{id}/start - Start session
-    """
-    try:
-        session = Session.objects.get(id=session_id)
-    except Session.DoesNotExist:
-        return Response(
-            {"error": "Session not found"}, status=status.HTTP_404_NOT_FOUND
-        )
-
-    if session.status != "created":
-        return Response(
-            {"error": f"Cannot start session with status: {session.status}"},
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    session.status = "running"
-    session.save()
+def statuses_leading_to(to_status):
+    """Return the statuses the model allows to move to to_status."""
+    return frozenset(old for old, new in VALID_STATUS_TRANSITIONS if new == to_status)
 
-    response_serializer = SessionSerializer(session)
-    return Response(response_serializer.data)
 
+def transition_session(session_id, from_statuses, to_status, timestamp_field):
+    """
+    Atomically move a session from one of from_statuses to to_status.
 
-@api_view(["POST"])
-def complete_session(request, session_id):
+    The status guard is part of the UPDATE's WHERE clause, so concurrent
+    requests cannot both pass it. Only statuses the model allows to move to
+    to_status are used, since the UPDATE bypasses Session.save() validation.
+    Returns the session as stored afterwards and whether this call changed
+    it; raises 404 for unknown sessions.
+    """
+    allowed = [
+        old for old in from_statuses if (old, to_status) in VALID_STATUS_TRANSITIONS
+    ]
+    now = timezone.now()
+    changed = Session.objects.filter(id=session_id, status__in=allowed).update(
+        status=to_status, updated_at=now, **{timestamp_field: now}
+    )
+    session = get_object_or_404(Session, id=session_id)
+    return session, bool(changed)
+
+
+class SessionTransitionView(APIView):
     """
-    Convenience endpoint to complete a session.
+    Convenience endpoints that move a session through its lifecycle.
 
+    POST /sessions/{id}/start - Start session (set status to running)
     POST /sessions/{id}/complete - Complete session
     """
-    try:
-        session = Session.objects.get(id=session_id)
-    except Session.DoesNotExist:
-        return Response(
-            {"error": "Session not found"}, status=status.HTTP_404_NOT_FOUND
-        )
 
-    if session.status not in ["running", "paused"]:
-        return Response(
-            {"error": f"Cannot complete session with status: {session.status}"},
-            status=status.HTTP_400_BAD_REQUEST,
+    renderer_classes = [ORJSONRenderer]
+
+    # action -> (statuses it may start from, new status, timestamp to set)
+    TRANSITIONS = {
+        # Only a new session can start; resuming a paused one keeps started_at
+        "start": (
+            statuses_leading_to(SessionStatus.RUNNING) & {SessionStatus.CREATED},
+            SessionStatus.RUNNING,
+            "started_at",
+        ),
+        "complete": (
+            statuses_leading_to(SessionStatus.COMPLETED),
+            SessionStatus.COMPLETED,
+            "finished_at",
+        ),
+    }
+
+    def post(self, request, session_id, action):
+        """Apply the named transition to the session."""
+        try:
+            from_statuses, to_status, timestamp_field = self.TRANSITIONS[action]
+        except KeyError:
+            raise Http404
+
+        session, changed = transition_session(
+            session_id, from_statuses, to_status, timestamp_field
         )
+        if not changed:
+            return Response(
+                {"error": f"Cannot {action} session with status: {session.status}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-    session.status = "completed"
-    session.save()
-
-    response_serializer = SessionSerializer(session)
-    return Response(response_serializer.data)
+        response_serializer = SessionSerializer(session)
+        return Response(response_serializer.data)
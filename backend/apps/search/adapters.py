@@ -6,22 +6,282 @@ and DuckDuckGo. Each adapter handles API-specific formatting and response parsin
 while providing a consistent interface for the meta-search orchestration service.
 """
 
+import asyncio
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import html
+import logging
+import os
+import random
 import re
 import requests
 import subprocess
 import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Any
-from urllib.parse import urlencode
-from bs4 import BeautifulSoup
+from dataclasses import asdict, dataclass
+from collections import defaultdict, deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlencode
+from bs4 import BeautifulSoup, SoupStrainer
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .utils import canonicalize_url
 
+logger = logging.getLogger(__name__)
+
+# Prefer the C-based lxml parser for result pages; html.parser is the
+# pure-Python fallback when lxml is not installed
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# orjson decodes API payloads straight from bytes and is several times faster
+# than the standard library; response.json() is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_WS_RE = re.compile(r"\s+")
+
+# Target URL inside Google (/url?q=...) and DuckDuckGo (/l/?uddg=...) redirects
+_GOOGLE_REDIR = re.compile(r"/url\?(?:[^&]*&)*?q=([^&]+)")
+_DDG_REDIR = re.compile(
+    r"(?:https?:)?(?://duckduckgo\.com)?/l/\?(?:[^&]*&)*?uddg=([^&]+)"
+)
+
+
+def _has_class(name: str):
+    """Match a class token; strainers see the raw, unsplit class attribute."""
+    return lambda value: bool(value) and name in value.split()
+
+
+# Only build the tree for result containers; the rest of a results page
+# (scripts, navigation, ads) is skipped while parsing
+GOOGLE_RESULTS = SoupStrainer("div", class_=_has_class("g"))
+BING_RESULTS = SoupStrainer("li", class_=_has_class("b_algo"))
+DUCKDUCKGO_RESULTS = SoupStrainer("div", class_=_has_class("result"))
+
+# Element matchers for walking a parsed page, built once instead of on every
+# find()/find_all() call
+_GOOGLE_ROW = SoupStrainer("div", class_="g")
+_GOOGLE_TITLE = SoupStrainer("h3")
+_GOOGLE_SNIPPET = SoupStrainer("div", class_=["VwiC3b", "s3v9rd"])
+_BING_ROW = SoupStrainer("li", class_="b_algo")
+_BING_TITLE = SoupStrainer("h2")
+_BING_SNIPPET = SoupStrainer("p")
+_LINK = SoupStrainer("a")
+_DDG_ROW = SoupStrainer("div", class_="result")
+_DDG_TITLE = SoupStrainer("a", class_="result__a")
+_DDG_SNIPPET = SoupStrainer("a", class_="result__snippet")
+
+
+def use_terminal_tools() -> bool:
+    """
+    Whether the lynx/curl adapters should shell out to their binaries.
+
+    Off by default: both adapters then fetch DuckDuckGo over the shared HTTP
+    session, avoiding a process spawn and TLS handshake per query. Set
+    SEARCH_USE_TERMINAL_TOOLS=true to use the installed binaries instead.
+    """
+    return os.environ.get("SEARCH_USE_TERMINAL_TOOLS", "False").lower() == "true"
+
+
+# Upper bound on how much of a results page is read; the first page of
+# results sits well within this, and the rest is scripts and footer markup
+MAX_PAGE_BYTES = 512 * 1024
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Retry connection errors and throttled/unavailable responses a couple of
+# times with exponential backoff (0.5s, 1s), honouring Retry-After
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Return the HTTP session shared by all search adapters.
+
+    Adapters are created per search, so a session per adapter would redo
+    the TCP and TLS handshakes for every query. The shared session keeps a
+    pool of keep-alive connections per host and is closed at exit.
+    """
+    global _http_session
+
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                pool = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=32, max_retries=RETRY_POLICY
+                )
+                session.mount("https://", pool)
+                session.mount("http://", pool)
+                session.headers.update({"User-Agent": DEFAULT_USER_AGENT})
+                atexit.register(session.close)
+                _http_session = session
+
+    return _http_session
+
+
+def clean_text(text: str) -> str:
+    """Decode HTML entities and collapse whitespace in result text."""
+    if not text:
+        return ""
+
+    # Decode HTML entities in one pass, then collapse whitespace
+    # (including the non-breaking spaces produced by &nbsp;)
+    return _WS_RE.sub(" ", html.unescape(text)).strip()
+
+
+# Parsers are top-level functions returning plain (title, url, snippet)
+# tuples so they can run in a worker process; adapters build SearchResult
+# objects from the rows in the calling thread.
+ParsedRow = Tuple[str, str, str]
+
+
+def parse_google_html(page: str, limit: int) -> List[ParsedRow]:
+    """Extract result rows from a Google results page."""
+    soup = BeautifulSoup(page, HTML_PARSER, parse_only=GOOGLE_RESULTS)
+    rows = []
+
+    for result_div in soup.find_all(_GOOGLE_ROW)[:limit]:
+        title_elem = result_div.find(_GOOGLE_TITLE)
+        link_elem = result_div.find(_LINK)
+        snippet_elem = result_div.find(_GOOGLE_SNIPPET)
+
+        if title_elem and link_elem:
+            title = clean_text(title_elem.get_text())
+            url = link_elem.get("href", "")
+            snippet = clean_text(snippet_elem.get_text() if snippet_elem else "")
+
+            # Extract actual URL from Google redirect
+            redirect = _GOOGLE_REDIR.match(url)
+            if redirect:
+                url = unquote(redirect.group(1))
+
+            if title and url:
+                rows.append((title, url, snippet))
+
+    return rows
+
+
+def parse_bing_html(page: str, limit: int) -> List[ParsedRow]:
+    """Extract result rows from a Bing results page."""
+    soup = BeautifulSoup(page, HTML_PARSER, parse_only=BING_RESULTS)
+    rows = []
+
+    for result_li in soup.find_all(_BING_ROW)[:limit]:
+        title_elem = result_li.find(_BING_TITLE)
+        link_elem = title_elem.find(_LINK) if title_elem else None
+        snippet_elem = result_li.find(_BING_SNIPPET)
+
+        if title_elem and link_elem:
+            title = clean_text(title_elem.get_text())
+            url = link_elem.get("href", "")
+            snippet = clean_text(snippet_elem.get_text() if snippet_elem else "")
+
+            if title and url:
+                rows.append((title, url, snippet))
+
+    return rows
+
+
+def parse_duckduckgo_html(page: str, limit: int) -> List[ParsedRow]:
+    """Extract result rows from a DuckDuckGo HTML results page."""
+    soup = BeautifulSoup(page, HTML_PARSER, parse_only=DUCKDUCKGO_RESULTS)
+    rows = []
+
+    for result_div in soup.find_all(_DDG_ROW)[:limit]:
+        title_elem = result_div.find(_DDG_TITLE)
+        snippet_elem = result_div.find(_DDG_SNIPPET)
+
+        if title_elem:
+            title = clean_text(title_elem.get_text())
+            url = title_elem.get("href", "")
+            snippet = clean_text(snippet_elem.get_text() if snippet_elem else "")
+
+            # DuckDuckGo uses redirect URLs, extract actual URL
+            redirect = _DDG_REDIR.match(url)
+            if redirect:
+                url = unquote(redirect.group(1))
+
+            if title and url:
+                rows.append((title, url, snippet))
+
+    return rows
+
+
+def parser_processes() -> int:
+    """
+    Number of worker processes used to parse result pages.
+
+    0 (the default) parses in the calling thread. Parsing holds the GIL, so
+    with several adapters running in threads, SEARCH_PARSER_PROCESSES=N moves
+    it onto N other cores while the threads keep fetching.
+    """
+    try:
+        return max(0, int(os.environ.get("SEARCH_PARSER_PROCESSES", "0")))
+    except ValueError:
+        return 0
+
+
+_parser_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_parser_pool_lock = threading.Lock()
 
-@dataclass
+
+def get_parser_pool(workers: int) -> concurrent.futures.ProcessPoolExecutor:
+    """Return the shared parser process pool, creating it on first use."""
+    global _parser_pool
+
+    if _parser_pool is None:
+        with _parser_pool_lock:
+            if _parser_pool is None:
+                _parser_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=workers
+                )
+                atexit.register(_parser_pool.shutdown)
+
+    return _parser_pool
+
+
+def run_parser(
+    parser: Callable[[str, int], List[ParsedRow]], page: str, limit: int
+) -> List[ParsedRow]:
+    """Run a page parser inline, or in the process pool when enabled."""
+    workers = parser_processes()
+    if not workers:
+        return parser(page, limit)
+    return get_parser_pool(workers).submit(parser, page, limit).result()
+
+
+@dataclass(slots=True)
 class SearchResult:
-    """Standardized search result representation."""
+    """
+    Standardized search result representation.
+
+    Slotted: meta-search builds many of these, and dropping the per-instance
+    __dict__ makes them smaller and faster to read.
+    """
 
     title: str
     url: str
@@ -37,17 +297,124 @@ class SearchResult:
         return f"SearchResult(title='{self.title[:50]}...', url='{self.url}', source='{self.source}')"
 
 
+class CircuitBreaker:
+    """
+    Track recent request failures per search engine.
+
+    After `threshold` failures within `window` seconds the engine's circuit
+    opens and its searches are skipped for `cooldown` seconds instead of
+    waiting on an engine that is down or rate limiting. Once the cooldown
+    passes requests are let through again; a success clears the history.
+    """
+
+    def __init__(
+        self, threshold: int = 5, window: float = 60.0, cooldown: float = 120.0
+    ):
+        """Initialize circuit breaker."""
+        self.threshold = threshold
+        self.window = window
+        self.cooldown = cooldown
+        self._failures: Dict[str, deque] = defaultdict(deque)
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def is_open(self, name: str) -> bool:
+        """Whether searches against the named engine should be skipped."""
+        with self._lock:
+            opened_at = self._opened_at.get(name)
+            if opened_at is None:
+                return False
+            if time.monotonic() - opened_at < self.cooldown:
+                return True
+            del self._opened_at[name]
+            self._failures.pop(name, None)
+            return False
+
+    def record_failure(self, name: str) -> None:
+        """Record a failed request, opening the circuit at the threshold."""
+        now = time.monotonic()
+        with self._lock:
+            failures = self._failures[name]
+            failures.append(now)
+            while failures and now - failures[0] > self.window:
+                failures.popleft()
+            if len(failures) >= self.threshold:
+                self._opened_at[name] = now
+
+    def record_success(self, name: str) -> None:
+        """Record a successful request, clearing the failure history."""
+        with self._lock:
+            self._failures.pop(name, None)
+            self._opened_at.pop(name, None)
+
+
+circuit_breaker = CircuitBreaker()
+
+
+def _is_transient(error: requests.RequestException) -> bool:
+    """Whether a request error suggests the engine is down or throttling."""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+def skip_open_circuit(search):
+    """Return no results without a request while the engine's circuit is open."""
+
+    @functools.wraps(search)
+    def wrapper(self, query: str, limit: int = 10) -> List[SearchResult]:
+        if circuit_breaker.is_open(self.get_name()):
+            logger.warning("Skipping %s: too many recent failures", self.get_name())
+            return []
+        return search(self, query, limit)
+
+    return wrapper
+
+
+def cached_search(search):
+    """
+    Cache an adapter's search() results for SEARCH_RESULT_CACHE_TIMEOUT seconds.
+
+    Entries are keyed by engine and query and hold plain dicts along with the
+    limit they were fetched for, so a later call with the same or a smaller
+    limit is served from the cache and a larger limit goes to the network.
+    Empty results are not cached, since they usually mean a failed request.
+    """
+
+    @functools.wraps(search)
+    def wrapper(self, query: str, limit: int = 10) -> List[SearchResult]:
+        timeout = getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", 0)
+        if not timeout:
+            return search(self, query, limit)
+
+        digest = hashlib.md5(query.encode("utf-8")).hexdigest()
+        key = f"serp:{self.get_name()}:{digest}"
+        cached = cache.get(key)
+        if cached is not None and cached["limit"] >= limit:
+            return [SearchResult(**row) for row in cached["results"][:limit]]
+
+        results = search(self, query, limit)
+        if results:
+            cache.set(
+                key,
+                {"limit": limit, "results": [asdict(r) for r in results]},
+                timeout,
+            )
+        return results
+
+    return wrapper
+
+
 class BaseSearchAdapter(ABC):
     """Abstract base class for search engine adapters."""
 
+    # Most searches the orchestrator sends to this engine at once
+    max_concurrency = 4
+
     def __init__(self):
         """Initialize base adapter."""
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-        )
+        self.session = get_http_session()
 
     @abstractmethod
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
@@ -63,27 +430,92 @@ class BaseSearchAdapter(ABC):
         """
         pass
 
+    async def asearch(self, query: str, limit: int = 10) -> List[SearchResult]:
+        """
+        Awaitable variant of search() for asyncio callers.
+
+        The blocking search() runs in a worker thread, so several adapters can
+        be awaited together with asyncio.gather() without blocking the loop.
+
+        Args:
+            query: Search query string
+            limit: Maximum number of results to return
+
+        Returns:
+            List of SearchResult objects
+        """
+        return await asyncio.to_thread(self.search, query, limit)
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this search adapter."""
         pass
 
-    def _clean_text(self, text: str) -> str:
-        """Clean and normalize text content."""
-        if not text:
-            return ""
+    def _decode_json(self, response: requests.Response) -> Dict[str, Any]:
+        """Decode a JSON API response, with orjson when it is installed."""
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
+
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        GET through the shared session and report the outcome to the breaker.
+
+        Raises:
+            requests.RequestException: If the request fails or returns an
+                error status
+        """
+        name = self.get_name()
+        try:
+            response = self.session.get(url, **kwargs)
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                response.close()
+                raise
+        except requests.RequestException as e:
+            if _is_transient(e):
+                circuit_breaker.record_failure(name)
+            raise
+
+        circuit_breaker.record_success(name)
+        return response
+
+    def _fetch_page(self, url: str, **kwargs) -> str:
+        """
+        GET a results page, reading at most MAX_PAGE_BYTES of the body.
+
+        The body is streamed and the connection released once the cap is
+        reached, so oversized pages are never held in memory in full.
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        response = self._get(url, stream=True, **kwargs)
+        try:
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                body += chunk
+                if len(body) >= MAX_PAGE_BYTES:
+                    break
 
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text.strip())
+            encoding = response.encoding or "utf-8"
+            return body[:MAX_PAGE_BYTES].decode(encoding, errors="replace")
+        finally:
+            response.close()
 
-        # Remove HTML entities
-        text = text.replace("&nbsp;", " ")
-        text = text.replace("&amp;", "&")
-        text = text.replace("&lt;", "<")
-        text = text.replace("&gt;", ">")
-        text = text.replace("&quot;", '"')
+    def _clean_text(self, text: str) -> str:
+        """Clean and normalize text content."""
+        return clean_text(text)
 
-        return text
+    def _parse_page(
+        self, parser: Callable[[str, int], List[ParsedRow]], page: str, limit: int
+    ) -> List[SearchResult]:
+        """Parse a results page and wrap the rows as this adapter's results."""
+        return [
+            SearchResult(title=title, url=url, snippet=snippet, source=self.get_name())
+            for title, url, snippet in run_parser(parser, page, limit)
+        ]
 
 
 class GoogleSearchAdapter(BaseSearchAdapter):
@@ -102,6 +534,8 @@ class GoogleSearchAdapter(BaseSearchAdapter):
         """Return adapter name."""
         return "google"
 
+    @cached_search
+    @skip_open_circuit
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
         Search using Google Custom Search API.
@@ -125,10 +559,9 @@ class GoogleSearchAdapter(BaseSearchAdapter):
                 "num": min(limit, 10),  # Google API max is 10 per request
             }
 
-            response = self.session.get(self.base_url, params=params)
-            response.raise_for_status()
+            response = self._get(self.base_url, params=params)
 
-            data = response.json()
+            data = self._decode_json(response)
             results = []
 
             for item in data.get("items", []):
@@ -142,8 +575,8 @@ class GoogleSearchAdapter(BaseSearchAdapter):
 
             return results
 
-        except Exception as e:
-            print(f"Google search error: {e}")
+        except Exception:
+            logger.exception("Google search error")
             return []
 
     def _search_scraping(self, query: str, limit: int = 10) -> List[SearchResult]:
@@ -152,42 +585,11 @@ class GoogleSearchAdapter(BaseSearchAdapter):
             params = {"q": query, "num": limit}
 
             url = f"https://www.google.com/search?{urlencode(params)}"
-            response = self.session.get(url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            results = []
-
-            # Parse Google search results
-            for result_div in soup.find_all("div", class_="g")[:limit]:
-                title_elem = result_div.find("h3")
-                link_elem = result_div.find("a")
-                snippet_elem = result_div.find("div", class_=["VwiC3b", "s3v9rd"])
-
-                if title_elem and link_elem:
-                    title = self._clean_text(title_elem.get_text())
-                    url = link_elem.get("href", "")
-                    snippet = self._clean_text(
-                        snippet_elem.get_text() if snippet_elem else ""
-                    )
-
-                    if url.startswith("/url?q="):
-                        # Extract actual URL from Google redirect
-                        url = url.split("/url?q=")[1].split("&")[0]
-
-                    if title and url:
-                        result = SearchResult(
-                            title=title,
-                            url=url,
-                            snippet=snippet,
-                            source=self.get_name(),
-                        )
-                        results.append(result)
-
-            return results
+            page = self._fetch_page(url)
+            return self._parse_page(parse_google_html, page, limit)
 
-        except Exception as e:
-            print(f"Google scraping error: {e}")
+        except Exception:
+            logger.exception("Google scraping error")
             return []
 
 
@@ -204,6 +606,8 @@ class BingSearchAdapter(BaseSearchAdapter):
         """Return adapter name."""
         return "bing"
 
+    @cached_search
+    @skip_open_circuit
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
         Search using Bing Search API.
@@ -228,10 +632,9 @@ class BingSearchAdapter(BaseSearchAdapter):
                 "responseFilter": "Webpages",
             }
 
-            response = self.session.get(self.base_url, headers=headers, params=params)
-            response.raise_for_status()
+            response = self._get(self.base_url, headers=headers, params=params)
 
-            data = response.json()
+            data = self._decode_json(response)
             results = []
 
             web_pages = data.get("webPages", {})
@@ -246,8 +649,8 @@ class BingSearchAdapter(BaseSearchAdapter):
 
             return results
 
-        except Exception as e:
-            print(f"Bing search error: {e}")
+        except Exception:
+            logger.exception("Bing search error")
             return []
 
     def _search_scraping(self, query: str, limit: int = 10) -> List[SearchResult]:
@@ -256,38 +659,11 @@ class BingSearchAdapter(BaseSearchAdapter):
             params = {"q": query, "count": limit}
 
             url = f"https://www.bing.com/search?{urlencode(params)}"
-            response = self.session.get(url)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-            results = []
-
-            # Parse Bing search results
-            for result_li in soup.find_all("li", class_="b_algo")[:limit]:
-                title_elem = result_li.find("h2")
-                link_elem = title_elem.find("a") if title_elem else None
-                snippet_elem = result_li.find("p")
-
-                if title_elem and link_elem:
-                    title = self._clean_text(title_elem.get_text())
-                    url = link_elem.get("href", "")
-                    snippet = self._clean_text(
-                        snippet_elem.get_text() if snippet_elem else ""
-                    )
-
-                    if title and url:
-                        result = SearchResult(
-                            title=title,
-                            url=url,
-                            snippet=snippet,
-                            source=self.get_name(),
-                        )
-                        results.append(result)
-
-            return results
+            page = self._fetch_page(url)
+            return self._parse_page(parse_bing_html, page, limit)
 
-        except Exception as e:
-            print(f"Bing scraping error: {e}")
+        except Exception:
+            logger.exception("Bing scraping error")
             return []
 
 
@@ -298,6 +674,8 @@ class DuckDuckGoSearchAdapter(BaseSearchAdapter):
         """Return adapter name."""
         return "duckduckgo"
 
+    @cached_search
+    @skip_open_circuit
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
         Search using DuckDuckGo (scraping).
@@ -317,49 +695,11 @@ class DuckDuckGoSearchAdapter(BaseSearchAdapter):
             }
 
             url = f"https://html.duckduckgo.com/html/?{urlencode(params)}"
-            response = self.session.get(url)
-            response.raise_for_status()
+            page = self._fetch_page(url)
+            return self._parse_page(parse_duckduckgo_html, page, limit)
 
-            soup = BeautifulSoup(response.text, "html.parser")
-            results = []
-
-            # Parse DuckDuckGo search results
-            for result_div in soup.find_all("div", class_="result")[:limit]:
-                title_elem = result_div.find("a", class_="result__a")
-                snippet_elem = result_div.find("a", class_="result__snippet")
-
-                if title_elem:
-                    title = self._clean_text(title_elem.get_text())
-                    url = title_elem.get("href", "")
-                    snippet = self._clean_text(
-                        snippet_elem.get_text() if snippet_elem else ""
-                    )
-
-                    # DuckDuckGo uses redirect URLs, extract actual URL
-                    if url.startswith("/l/?kh="):
-                        # Extract actual URL from DuckDuckGo redirect
-                        try:
-                            import urllib.parse
-
-                            parsed = urllib.parse.parse_qs(url.split("?")[1])
-                            if "uddg" in parsed:
-                                url = urllib.parse.unquote(parsed["uddg"][0])
-                        except:
-                            pass
-
-                    if title and url:
-                        result = SearchResult(
-                            title=title,
-                            url=url,
-                            snippet=snippet,
-                            source=self.get_name(),
-                        )
-                        results.append(result)
-
-            return results
-
-        except Exception as e:
-            print(f"DuckDuckGo search error: {e}")
+        except Exception:
+            logger.exception("DuckDuckGo search error")
             return []
 
 
@@ -369,12 +709,15 @@ class LynxSearchAdapter(BaseSearchAdapter):
     def __init__(self):
         """Initialize Lynx search adapter."""
         super().__init__()
-        self.lynx_available = shutil.which("lynx") is not None
+        self.lynx_available = use_terminal_tools() and shutil.which("lynx") is not None
+        self._fallback_adapter: Optional[DuckDuckGoSearchAdapter] = None
 
     def get_name(self) -> str:
         """Return adapter name."""
         return "lynx"
 
+    @cached_search
+    @skip_open_circuit
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
         Search using Lynx terminal browser for DuckDuckGo.
@@ -387,12 +730,12 @@ class LynxSearchAdapter(BaseSearchAdapter):
             List of SearchResult objects
         """
         if not self.lynx_available:
-            print("Lynx not available, falling back to requests")
             return self._fallback_search(query, limit)
 
         try:
             # Use DuckDuckGo with Lynx (less likely to be blocked)
-            search_url = f"https://html.duckduckgo.com/html/?q={query}&s=0&dc={limit}"
+            params = {"q": query, "s": "0", "dc": str(limit)}
+            search_url = f"https://html.duckduckgo.com/html/?{urlencode(params)}"
 
             # Use Lynx to get text output
             cmd = [
@@ -407,13 +750,13 @@ class LynxSearchAdapter(BaseSearchAdapter):
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
 
             if result.returncode != 0:
-                print(f"Lynx command failed: {result.stderr}")
+                logger.warning("Lynx command failed: %s", result.stderr)
                 return self._fallback_search(query, limit)
 
             return self._parse_lynx_output(result.stdout)
 
-        except Exception as e:
-            print(f"Lynx search error: {e}")
+        except Exception:
+            logger.exception("Lynx search error")
             return self._fallback_search(query, limit)
 
     def _parse_lynx_output(self, text: str) -> List[SearchResult]:
@@ -462,22 +805,33 @@ class LynxSearchAdapter(BaseSearchAdapter):
 
     def _fallback_search(self, query: str, limit: int) -> List[SearchResult]:
         """Fallback to regular DuckDuckGo adapter if Lynx fails."""
-        fallback = DuckDuckGoSearchAdapter()
-        return fallback.search(query, limit)
+        # Reuse one adapter rather than building a new one per fallback
+        if self._fallback_adapter is None:
+            self._fallback_adapter = DuckDuckGoSearchAdapter()
+        return self._fallback_adapter.search(query, limit)
 
 
 class CurlSearchAdapter(BaseSearchAdapter):
     """Terminal-based search adapter using curl with custom headers."""
 
+    # Rotating user agents to avoid detection
+    user_agents = [
+        "Mozilla/5.0 (X11; Linux x86_64; rv:91.0) Gecko/20100101 Firefox/91.0",
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
+    ]
+
     def __init__(self):
         """Initialize curl search adapter."""
         super().__init__()
-        self.curl_available = shutil.which("curl") is not None
+        self.curl_available = use_terminal_tools() and shutil.which("curl") is not None
 
     def get_name(self) -> str:
         """Return adapter name."""
         return "curl"
 
+    @cached_search
+    @skip_open_circuit
     def search(self, query: str, limit: int = 10) -> List[SearchResult]:
         """
         Search using curl with rotating user agents.
@@ -489,24 +843,15 @@ class CurlSearchAdapter(BaseSearchAdapter):
         Returns:
             List of SearchResult objects
         """
+        # Use DuckDuckGo with a random user agent
+        params = {"q": query, "s": "0", "dc": str(limit)}
+        search_url = f"https://html.duckduckgo.com/html/?{urlencode(params)}"
+        user_agent = random.choice(self.user_agents)
+
         if not self.curl_available:
-            return []
+            return self._http_search(search_url, user_agent, limit)
 
         try:
-            # Use DuckDuckGo with curl and random user agent
-            search_url = f"https://html.duckduckgo.com/html/?q={query}&s=0&dc={limit}"
-
-            # Rotating user agents to avoid detection
-            user_agents = [
-                "Mozilla/5.0 (X11; Linux x86_64; rv:91.0) Gecko/20100101 Firefox/91.0",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15",
-            ]
-
-            import random
-
-            user_agent = random.choice(user_agents)
-
             cmd = [
                 "curl",
                 "-s",
@@ -529,36 +874,30 @@ class CurlSearchAdapter(BaseSearchAdapter):
             if result.returncode != 0:
                 return []
 
-            # Parse HTML using BeautifulSoup
-            soup = BeautifulSoup(result.stdout, "html.parser")
-            return self._parse_curl_results(soup)
+            return self._parse_page(parse_duckduckgo_html, result.stdout, limit)
 
-        except Exception as e:
-            print(f"Curl search error: {e}")
+        except Exception:
+            logger.exception("Curl search error")
             return []
 
-    def _parse_curl_results(self, soup: BeautifulSoup) -> List[SearchResult]:
-        """Parse curl results from DuckDuckGo HTML."""
-        results = []
-
-        for result_div in soup.find_all("div", class_="result")[:10]:
-            title_elem = result_div.find("a", class_="result__a")
-            snippet_elem = result_div.find("a", class_="result__snippet")
-
-            if title_elem:
-                title = self._clean_text(title_elem.get_text())
-                url = title_elem.get("href", "")
-                snippet = self._clean_text(
-                    snippet_elem.get_text() if snippet_elem else ""
-                )
-
-                if title and url:
-                    result = SearchResult(
-                        title=title, url=url, snippet=snippet, source=self.get_name()
-                    )
-                    results.append(result)
+    def _http_search(
+        self, search_url: str, user_agent: str, limit: int
+    ) -> List[SearchResult]:
+        """Fetch results over the shared HTTP session instead of spawning curl."""
+        try:
+            page = self._fetch_page(
+                search_url,
+                headers={
+                    "User-Agent": user_agent,
+                    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+                    "Accept-Language": "en-US,en;q=0.5",
+                },
+            )
+            return self._parse_page(parse_duckduckgo_html, page, limit)
 
-        return results
+        except Exception:
+            logger.exception("Curl search error")
+            return []
 
 
 class SearchAdapterFactory:
@@ -572,11 +911,18 @@ class SearchAdapterFactory:
         "curl": CurlSearchAdapter,
     }
 
+    # Adapters hold no per-search state, so one instance per name and
+    # constructor arguments is shared instead of rebuilt for every search
+    _instances: Dict[Tuple[str, frozenset], BaseSearchAdapter] = {}
+
     @classmethod
     def get_adapter(cls, adapter_name: str, **kwargs) -> BaseSearchAdapter:
         """
         Get a search adapter by name.
 
+        Instances are cached per (adapter_name, kwargs); use clear_cache()
+        to force new adapters to be built.
+
         Args:
             adapter_name: Name of the adapter ('google', 'bing', 'duckduckgo')
             **kwargs: Additional arguments to pass to adapter constructor
@@ -593,8 +939,17 @@ class SearchAdapterFactory:
                 f"Unknown adapter '{adapter_name}'. Available: {available}"
             )
 
-        adapter_class = cls._adapters[adapter_name]
-        return adapter_class(**kwargs)
+        key = (adapter_name, frozenset(kwargs.items()))
+        adapter = cls._instances.get(key)
+        if adapter is None:
+            adapter_class = cls._adapters[adapter_name]
+            adapter = cls._instances.setdefault(key, adapter_class(**kwargs))
+        return adapter
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached adapter instances."""
+        cls._instances.clear()
 
     @classmethod
     def get_available_adapters(cls) -> List[str]:
@@ -609,7 +964,7 @@ class SearchAdapterFactory:
             try:
                 adapter = cls.get_adapter(adapter_name, **kwargs)
                 adapters.append(adapter)
-            except Exception as e:
-                print(f"Failed to create adapter '{adapter_name}': {e}")
+            except Exception:
+                logger.exception("Failed to create adapter %r", adapter_name)
 
         return adapters
@@ -1,14 +1,36 @@
 """Django admin configuration for search application."""
 
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 from .models import SearchQuery, SearchResult
 
 
+class SearchResultChangeList(ChangeList):
+    """Changelist that loads only the columns it displays."""
+
+    def get_queryset(self, request, *args, **kwargs):
+        """Defer wide text columns (url, description) on the list page."""
+        return (
+            super()
+            .get_queryset(request, *args, **kwargs)
+            .only(
+                "id",
+                "title",
+                "search_engine",
+                "rank",
+                "created_at",
+                "query__id",
+                "query__query_text",
+            )
+        )
+
+
 @admin.register(SearchQuery)
 class SearchQueryAdmin(admin.ModelAdmin):
     """Admin interface for SearchQuery model."""
 
     list_display = ["query_text", "query_type", "subject", "created_at"]
+    list_select_related = ["subject"]
     list_filter = ["query_type", "created_at"]
     search_fields = ["query_text", "subject__name"]
     date_hierarchy = "created_at"
@@ -25,6 +47,7 @@ class SearchResultAdmin(admin.ModelAdmin):
     """Admin interface for SearchResult model."""
 
     list_display = ["title", "search_engine", "rank", "query", "created_at"]
+    list_select_related = ["query"]
     list_filter = ["search_engine", "created_at"]
     search_fields = ["title", "url", "description"]
     date_hierarchy = "created_at"
@@ -41,3 +64,7 @@ class SearchResultAdmin(admin.ModelAdmin):
             },
         ),
     )
+
+    def get_changelist(self, request, **kwargs):
+        """Use the column-trimmed changelist."""
+        return SearchResultChangeList
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 03:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("search", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="searchresult",
+            index=models.Index(fields=["query", "rank"], name="sres_query_rank_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="searchresult",
+            index=models.Index(
+                fields=["search_engine", "-created_at"], name="sres_engine_created_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,61 @@
+from django.db import migrations, models
+
+# String values stored before query_type became an integer column
+QUERY_TYPE_CODES = {
+    "general": 1,
+    "person": 2,
+    "organization": 3,
+    "domain": 4,
+    "email": 5,
+}
+
+
+def forwards(apps, schema_editor):
+    SearchQuery = apps.get_model("search", "SearchQuery")
+    for name, code in QUERY_TYPE_CODES.items():
+        SearchQuery.objects.filter(query_type=name).update(query_type_code=code)
+
+
+def backwards(apps, schema_editor):
+    SearchQuery = apps.get_model("search", "SearchQuery")
+    for name, code in QUERY_TYPE_CODES.items():
+        SearchQuery.objects.filter(query_type_code=code).update(query_type=name)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("search", "0002_search_result_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchquery",
+            name="query_type_code",
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(
+            model_name="searchquery",
+            name="query_type",
+        ),
+        migrations.RenameField(
+            model_name="searchquery",
+            old_name="query_type_code",
+            new_name="query_type",
+        ),
+        migrations.AlterField(
+            model_name="searchquery",
+            name="query_type",
+            field=models.PositiveSmallIntegerField(
+                choices=[
+                    (1, "General Search"),
+                    (2, "Person Search"),
+                    (3, "Organization Search"),
+                    (4, "Domain Search"),
+                    (5, "Email Search"),
+                ],
+                default=1,
+                help_text="Type of search query",
+            ),
+        ),
+    ]
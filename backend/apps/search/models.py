@@ -8,21 +8,26 @@ results, and metadata for the meta-search functionality.
 from django.db import models
 from django.utils import timezone
 
+from .utils import canonicalize_url
+
+
+class QueryType(models.IntegerChoices):
+    """Type choices for search queries, stored as small integers."""
+
+    GENERAL = 1, "General Search"
+    PERSON = 2, "Person Search"
+    ORGANIZATION = 3, "Organization Search"
+    DOMAIN = 4, "Domain Search"
+    EMAIL = 5, "Email Search"
+
 
 class SearchQuery(models.Model):
     """Model for storing search queries and their metadata."""
 
     query_text = models.TextField(help_text="The search query text")
-    query_type = models.CharField(
-        max_length=50,
-        choices=[
-            ("general", "General Search"),
-            ("person", "Person Search"),
-            ("organization", "Organization Search"),
-            ("domain", "Domain Search"),
-            ("email", "Email Search"),
-        ],
-        default="general",
+    query_type = models.PositiveSmallIntegerField(
+        choices=QueryType.choices,
+        default=QueryType.GENERAL,
         help_text="Type of search query",
     )
     created_at = models.DateTimeField(
@@ -44,6 +49,41 @@ class SearchQuery(models.Model):
         return f"Search: {self.query_text[:50]}..."
 
 
+class SearchResultManager(models.Manager):
+    """Manager adding batch persistence for adapter search results."""
+
+    def bulk_create_from_results(self, query, results, batch_size=500):
+        """
+        Store adapter results for a query in batched INSERTs.
+
+        Results are ranked by their position in the list. Rows that already
+        exist for the same query, URL and search engine are skipped by the
+        database rather than raising IntegrityError.
+
+        Args:
+            query: SearchQuery the results belong to
+            results: Iterable of adapter SearchResult objects
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            List of the SearchResult instances passed to bulk_create
+        """
+        title_length = self.model._meta.get_field("title").max_length
+        rows = [
+            self.model(
+                query=query,
+                title=result.title[:title_length],
+                url=result.url,
+                canonical_url=canonicalize_url(result.url),
+                description=result.snippet,
+                search_engine=result.source,
+                rank=rank,
+            )
+            for rank, result in enumerate(results, start=1)
+        ]
+        return self.bulk_create(rows, batch_size=batch_size, ignore_conflicts=True)
+
+
 class SearchResult(models.Model):
     """Model for storing individual search results."""
 
@@ -69,9 +109,20 @@ class SearchResult(models.Model):
         default=timezone.now, help_text="When this result was captured"
     )
 
+    objects = SearchResultManager()
+
     class Meta:
         ordering = ["rank"]
         unique_together = ["query", "url", "search_engine"]
+        indexes = [
+            # Results for one query in rank order
+            models.Index(fields=["query", "rank"], name="sres_query_rank_idx"),
+            # Admin and reporting views filtered by engine, newest first
+            models.Index(
+                fields=["search_engine", "-created_at"],
+                name="sres_engine_created_idx",
+            ),
+        ]
         verbose_name = "Search Result"
         verbose_name_plural = "Search Results"
 
@@ -7,16 +7,65 @@ strategies and performance optimization.
 """
 
 import time
+import array
 import asyncio
+import heapq
+import logging
 import concurrent.futures
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields, replace
 from enum import Enum
-from typing import List, Dict, Optional, Set, Any
-from collections import defaultdict
+from typing import List, Dict, FrozenSet, Iterable, Optional, Set, Any, Tuple
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
 import threading
 
+from django.conf import settings
+
 from .adapters import SearchAdapterFactory, BaseSearchAdapter, SearchResult
-from .utils import deduplicate_urls
+from .utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=16384)
+def tokenize(text: str) -> FrozenSet[str]:
+    """
+    Lowercased word set used for query/result term matching.
+
+    Memoized per string, so titles and snippets seen again (re-ranking,
+    repeated queries, the same page from several engines) are not re-split.
+    Use tokenize.cache_clear() to reset.
+    """
+    return frozenset(text.lower().split())
+
+
+# Simplified domain authority based on domain characteristics; the first
+# indicator found in the URL wins
+DOMAIN_INDICATORS = (
+    (".edu", 0.9),
+    (".gov", 0.95),
+    (".org", 0.8),
+    ("wikipedia", 0.85),
+    ("github", 0.8),
+    ("stackoverflow", 0.8),
+)
+
+
+@lru_cache(maxsize=16384)
+def domain_authority(url: str) -> float:
+    """
+    Heuristic authority score for a URL, 0.5 for unknown domains.
+
+    Memoized per URL, since the same pages come back from several engines
+    and across repeated searches.
+    """
+    url_lower = url.lower()
+    for indicator, score in DOMAIN_INDICATORS:
+        if indicator in url_lower:
+            return score
+
+    # Default score for unknown domains
+    return 0.5
 
 
 class SearchStrategy(Enum):
@@ -27,7 +76,7 @@ class SearchStrategy(Enum):
     ADAPTIVE = "adaptive"  # Start with fast adapters, add slower ones
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchConfig:
     """Configuration for meta-search orchestration."""
 
@@ -42,6 +91,13 @@ class SearchConfig:
     min_snippet_length: int = 20
     max_total_results: int = 50
 
+    def signature(self) -> Tuple:
+        """Hashable snapshot of the settings, used in result cache keys."""
+        return tuple(
+            tuple(value) if isinstance(value, list) else value
+            for value in (getattr(self, f.name) for f in fields(self))
+        )
+
 
 class ResultRanker:
     """Ranks search results based on relevance and quality metrics."""
@@ -67,7 +123,7 @@ class ResultRanker:
         }
 
     def rank_results(
-        self, results: List[SearchResult], query: str
+        self, results: List[SearchResult], query: str, top_k: Optional[int] = None
     ) -> List[SearchResult]:
         """
         Rank search results by relevance and quality.
@@ -75,6 +131,7 @@ class ResultRanker:
         Args:
             results: List of search results to rank
             query: Original search query for relevance scoring
+            top_k: Only return this many of the best results, or None for all
 
         Returns:
             Ranked list of search results
@@ -82,72 +139,103 @@ class ResultRanker:
         if not results:
             return []
 
-        query_terms = set(query.lower().split())
-        scored_results = []
+        query_terms = tokenize(query)
+        scores = self._score_results(results, query_terms)
 
+        # Order indices by score (descending); ties keep their original order
+        indices = range(len(results))
+        if top_k is not None and top_k < len(results):
+            order = heapq.nlargest(top_k, indices, key=scores.__getitem__)
+        else:
+            order = sorted(indices, key=scores.__getitem__, reverse=True)
+        return [results[i] for i in order]
+
+    def _score_results(
+        self, results: List[SearchResult], query_terms: Set[str]
+    ) -> List[float]:
+        """Calculate relevance scores for a list of results in a single pass."""
+        factors = self.ranking_factors
+        title_weight = factors["title_relevance"]
+        snippet_weight = factors["snippet_relevance"]
+        url_weight = factors["url_quality"]
+        source_weight = factors["source_reliability"]
+        content_weight = factors["content_length"]
+        domain_weight = factors["domain_authority"]
+
+        # Matches count distinct query terms, so scale them by 1/len(terms)
+        term_scale = 1 / len(query_terms) if query_terms else 0.0
+        source_scores = self.source_scores
+        intersect = query_terms.intersection
+        tokens = tokenize
+
+        scores = []
         for result in results:
-            score = self._calculate_result_score(result, query_terms)
-            scored_results.append((score, result))
-
-        # Sort by score (descending) and return results
-        scored_results.sort(key=lambda x: x[0], reverse=True)
-        return [result for score, result in scored_results]
-
-    def _calculate_result_score(
-        self, result: SearchResult, query_terms: Set[str]
-    ) -> float:
-        """Calculate relevance score for a single result."""
-        score = 0.0
-
-        # Title relevance
-        title_words = set(result.title.lower().split())
-        title_matches = len(query_terms.intersection(title_words))
-        title_score = title_matches / len(query_terms) if query_terms else 0
-        score += title_score * self.ranking_factors["title_relevance"]
-
-        # Snippet relevance
-        snippet_words = set(result.snippet.lower().split())
-        snippet_matches = len(query_terms.intersection(snippet_words))
-        snippet_score = snippet_matches / len(query_terms) if query_terms else 0
-        score += snippet_score * self.ranking_factors["snippet_relevance"]
-
-        # URL quality (shorter, cleaner URLs score higher)
-        url_score = max(0, 1 - (len(result.url) / 100))
-        score += url_score * self.ranking_factors["url_quality"]
-
-        # Source reliability
-        source_score = self.source_scores.get(result.source, 0.5)
-        score += source_score * self.ranking_factors["source_reliability"]
-
-        # Content length (longer snippets generally better)
-        content_score = min(1.0, len(result.snippet) / 200)
-        score += content_score * self.ranking_factors["content_length"]
-
-        # Domain authority (simplified heuristic)
-        domain_score = self._calculate_domain_authority(result.url)
-        score += domain_score * self.ranking_factors["domain_authority"]
-
-        return score
-
-    def _calculate_domain_authority(self, url: str) -> float:
-        """Calculate simple domain authority score."""
-        # Simplified domain authority based on domain characteristics
-        domain_indicators = {
-            ".edu": 0.9,
-            ".gov": 0.95,
-            ".org": 0.8,
-            "wikipedia": 0.85,
-            "github": 0.8,
-            "stackoverflow": 0.8,
-        }
+            snippet = result.snippet
+            scores.append(
+                # Title and snippet relevance
+                len(intersect(tokens(result.title))) * term_scale * title_weight
+                + len(intersect(tokens(snippet))) * term_scale * snippet_weight
+                # URL quality (shorter, cleaner URLs score higher)
+                + max(0, 1 - len(result.url) / 100) * url_weight
+                # Source reliability
+                + source_scores.get(result.source, 0.5) * source_weight
+                # Content length (longer snippets generally better)
+                + min(1.0, len(snippet) / 200) * content_weight
+                # Domain authority (simplified heuristic)
+                + domain_authority(result.url) * domain_weight
+            )
 
-        url_lower = url.lower()
-        for indicator, score in domain_indicators.items():
-            if indicator in url_lower:
-                return score
+        return scores
 
-        # Default score for unknown domains
-        return 0.5
+
+# Worker threads shared by all parallel searches of one orchestrator
+PARALLEL_SEARCH_WORKERS = 32
+
+# Concurrent searches allowed per engine for adapters that don't declare
+# max_concurrency
+DEFAULT_ADAPTER_CONCURRENCY = 4
+
+_adapter_slots: Dict[str, threading.BoundedSemaphore] = {}
+_adapter_slots_lock = threading.Lock()
+
+
+def adapter_slots(adapter: BaseSearchAdapter) -> threading.BoundedSemaphore:
+    """
+    Process-wide semaphore bounding concurrent searches on one engine.
+
+    Shared by every orchestrator, so batched and concurrent searches can't
+    flood a single upstream engine past its max_concurrency.
+    """
+    name = adapter.get_name()
+    with _adapter_slots_lock:
+        slots = _adapter_slots.get(name)
+        if slots is None:
+            if isinstance(adapter, BaseSearchAdapter):
+                limit = adapter.max_concurrency
+            else:
+                limit = DEFAULT_ADAPTER_CONCURRENCY
+            slots = _adapter_slots[name] = threading.BoundedSemaphore(limit)
+        return slots
+
+
+# Slots of the per-adapter performance counters in search_stats
+CALLS, SUCCESSES, TOTAL_TIME = range(3)
+ADAPTER_STATS = (0.0, 0.0, 0.0)
+
+
+class AdapterCall:
+    """
+    Outcome marker for one adapter call run on a worker thread.
+
+    A call is counted in the adapter statistics exactly once: either by the
+    worker when the search finishes, or by the caller when it gives up on it
+    at the timeout, whichever happens first.
+    """
+
+    __slots__ = ("settled",)
+
+    def __init__(self):
+        self.settled = False
 
 
 class MetaSearchOrchestrator:
@@ -158,23 +246,52 @@ class MetaSearchOrchestrator:
     with deduplication, ranking, and performance optimization.
     """
 
-    def __init__(self, config: Optional[SearchConfig] = None):
-        """Initialize meta-search orchestrator."""
+    def __init__(self, config: Optional[SearchConfig] = None, cache_size: int = 1024):
+        """
+        Initialize meta-search orchestrator.
+
+        Args:
+            config: Search configuration, defaults to SearchConfig()
+            cache_size: Maximum number of query results kept in the LRU
+                result cache, 0 to disable caching; entries also expire
+                after SEARCH_RESULT_CACHE_TIMEOUT seconds
+        """
         self.config = config or SearchConfig()
         self.ranker = ResultRanker()
         self.adapters: List[BaseSearchAdapter] = []
 
+        # Ranked results of recent searches, least recently used first
+        self.cache_size = cache_size
+        # Values are (monotonic time stored, results); entries expire after
+        # SEARCH_RESULT_CACHE_TIMEOUT seconds, like the adapter-level cache
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, List[SearchResult]]]" = (
+            OrderedDict()
+        )
+
         # Performance tracking
-        self.search_stats = {
+        self.search_stats = self._new_search_stats()
+        self._stats_lock = threading.Lock()
+
+        # Reused across searches so worker threads (and their warm HTTP
+        # connections) outlive a single query; released by close() or by
+        # using the orchestrator as a context manager
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=PARALLEL_SEARCH_WORKERS, thread_name_prefix="meta-search"
+        )
+
+    @staticmethod
+    def _new_search_stats() -> Dict[str, Any]:
+        """Build zeroed search statistics."""
+        return {
             "total_searches": 0,
             "successful_searches": 0,
             "failed_searches": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
             "total_response_time": 0.0,
-            "adapter_performance": defaultdict(
-                lambda: {"calls": 0, "successes": 0, "total_time": 0.0}
-            ),
+            # Per adapter: [calls, successes, total_time]
+            "adapter_performance": defaultdict(lambda: array.array("d", ADAPTER_STATS)),
         }
-        self._stats_lock = threading.Lock()
 
     def load_adapters(self, adapter_names: Optional[List[str]] = None) -> None:
         """
@@ -183,21 +300,25 @@ class MetaSearchOrchestrator:
         Args:
             adapter_names: Specific adapters to load, or None for all available
         """
-        self.adapters = []
+        # Build the new list before publishing it, so searches running
+        # concurrently never see a partially loaded adapter set
+        adapters = []
 
         if adapter_names:
             # Load specific adapters
             for name in adapter_names:
                 try:
                     adapter = SearchAdapterFactory.get_adapter(name)
-                    self.adapters.append(adapter)
+                    adapters.append(adapter)
                 except Exception as e:
-                    print(f"Failed to load adapter '{name}': {e}")
+                    logger.warning("Failed to load adapter '%s': %s", name, e)
         else:
             # Load all available adapters
-            self.adapters = SearchAdapterFactory.create_all_adapters()
+            adapters = SearchAdapterFactory.create_all_adapters()
+
+        self.adapters = adapters
 
-        print(f"Loaded {len(self.adapters)} search adapters")
+        logger.info("Loaded %d search adapters", len(self.adapters))
 
     def search(
         self,
@@ -219,8 +340,10 @@ class MetaSearchOrchestrator:
         search_config = config or self.config
         start_time = time.time()
 
-        with self._stats_lock:
-            self.search_stats["total_searches"] += 1
+        cache_key = self._cache_key(query, strategy, search_config)
+        cached = self._get_cached_results(cache_key, start_time)
+        if cached is not None:
+            return cached
 
         try:
             # Execute search based on strategy
@@ -233,77 +356,355 @@ class MetaSearchOrchestrator:
             else:
                 raise ValueError(f"Unknown search strategy: {strategy}")
 
-            # Post-process results
-            if search_config.enable_deduplication:
-                results = self._deduplicate_results(results)
+            results = self._post_process_results(results, query, search_config)
+
+            # Update statistics
+            with self._stats_lock:
+                self.search_stats["successful_searches"] += 1
+                self.search_stats["total_response_time"] += time.time() - start_time
+                self._cache_results(cache_key, results)
 
-            if search_config.enable_ranking:
-                results = self.ranker.rank_results(results, query)
+            return results
 
-            # Limit total results
-            results = results[: search_config.max_total_results]
+        except Exception:
+            with self._stats_lock:
+                self.search_stats["failed_searches"] += 1
+            logger.exception("Meta-search failed")
+            return []
+
+    async def asearch(
+        self,
+        query: str,
+        strategy: SearchStrategy = SearchStrategy.PARALLEL,
+        config: Optional[SearchConfig] = None,
+    ) -> List[SearchResult]:
+        """
+        Awaitable variant of search() for asyncio callers.
+
+        The parallel strategy fans out on the event loop: every adapter is
+        awaited concurrently under its own timeout, so one slow engine no
+        longer fails the whole search. Other strategies run search() in a
+        worker thread.
+
+        Args:
+            query: Search query string
+            strategy: Search execution strategy
+            config: Optional config override
+
+        Returns:
+            Ranked and deduplicated search results
+        """
+        if strategy != SearchStrategy.PARALLEL:
+            return await asyncio.to_thread(self.search, query, strategy, config)
+
+        search_config = config or self.config
+        start_time = time.time()
+
+        cache_key = self._cache_key(query, strategy, search_config)
+        cached = self._get_cached_results(cache_key, start_time)
+        if cached is not None:
+            return cached
+
+        try:
+            results = await self._aexecute_parallel_search(query, search_config)
+            results = self._post_process_results(results, query, search_config)
 
-            # Update statistics
             with self._stats_lock:
                 self.search_stats["successful_searches"] += 1
                 self.search_stats["total_response_time"] += time.time() - start_time
+                self._cache_results(cache_key, results)
 
             return results
 
-        except Exception as e:
+        except Exception:
             with self._stats_lock:
                 self.search_stats["failed_searches"] += 1
-            print(f"Meta-search failed: {e}")
+            logger.exception("Meta-search failed")
             return []
 
-    def _execute_parallel_search(
-        self, query: str, config: SearchConfig
+    def search_single(
+        self, query: str, adapter_name: str, limit: Optional[int] = None
     ) -> List[SearchResult]:
-        """Execute search across all adapters in parallel."""
-        if not self.adapters:
+        """
+        Search a single adapter directly.
+
+        Skips strategy dispatch, the worker pool and the result cache; the
+        adapter still gets its quality filter, rate limit and statistics.
+
+        Args:
+            query: Search query string
+            adapter_name: Adapter to search with
+            limit: Results to request, defaults to max_results_per_adapter
+
+        Returns:
+            Ranked and deduplicated search results
+        """
+        config = self.config
+        if limit is not None:
+            config = replace(config, max_results_per_adapter=limit)
+        start_time = time.time()
+
+        try:
+            adapter = SearchAdapterFactory.get_adapter(adapter_name)
+            results = self._search_with_adapter(adapter, query, config)
+            results = self._post_process_results(results, query, config)
+        except Exception:
+            with self._stats_lock:
+                self.search_stats["total_searches"] += 1
+                self.search_stats["failed_searches"] += 1
+            logger.exception("Search with %s failed", adapter_name)
             return []
 
-        results = []
+        with self._stats_lock:
+            self.search_stats["total_searches"] += 1
+            self.search_stats["successful_searches"] += 1
+            self.search_stats["total_response_time"] += time.time() - start_time
+
+        return results
+
+    def search_batch(
+        self,
+        queries: List[str],
+        strategy: SearchStrategy = SearchStrategy.PARALLEL,
+        config: Optional[SearchConfig] = None,
+        max_concurrent_queries: int = 4,
+    ) -> Dict[str, List[SearchResult]]:
+        """
+        Execute several searches concurrently.
+
+        Args:
+            queries: Search query strings; repeated queries run once
+            strategy: Search execution strategy
+            config: Optional config override
+            max_concurrent_queries: Queries allowed in flight at once
+
+        Returns:
+            Mapping of each query to its ranked and deduplicated results
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        if not unique_queries:
+            return {}
 
-        # Use ThreadPoolExecutor for parallel execution
         with concurrent.futures.ThreadPoolExecutor(
-            max_workers=len(self.adapters)
+            max_workers=min(max_concurrent_queries, len(unique_queries))
         ) as executor:
-            # Submit all search tasks
-            future_to_adapter = {
-                executor.submit(
-                    self._search_with_adapter, adapter, query, config
-                ): adapter
-                for adapter in self.adapters
-            }
-
-            # Collect results as they complete
-            for future in concurrent.futures.as_completed(
-                future_to_adapter, timeout=config.timeout_seconds
-            ):
-                adapter = future_to_adapter[future]
-                try:
-                    adapter_results = future.result()
-                    results.extend(adapter_results)
-                except Exception as e:
-                    print(f"Adapter {adapter.get_name()} failed: {e}")
-                    self._update_adapter_stats(adapter.get_name(), success=False)
+            batch_results = executor.map(
+                lambda query: self.search(query, strategy, config), unique_queries
+            )
+            return dict(zip(unique_queries, batch_results))
+
+    async def asearch_batch(
+        self,
+        queries: List[str],
+        strategy: SearchStrategy = SearchStrategy.PARALLEL,
+        config: Optional[SearchConfig] = None,
+        max_concurrent_queries: int = 4,
+    ) -> Dict[str, List[SearchResult]]:
+        """
+        Awaitable variant of search_batch().
+
+        Every query goes through asearch(), so cached queries skip the
+        adapter fan-out and each adapter call keeps its own timeout.
+        """
+        unique_queries = list(dict.fromkeys(queries))
+        semaphore = asyncio.Semaphore(max_concurrent_queries)
+
+        async def run(query: str) -> List[SearchResult]:
+            async with semaphore:
+                return await self.asearch(query, strategy, config)
+
+        batch_results = await asyncio.gather(*(run(q) for q in unique_queries))
+        return dict(zip(unique_queries, batch_results))
+
+    def _cache_key(
+        self, query: str, strategy: SearchStrategy, config: SearchConfig
+    ) -> Tuple:
+        """Build the result cache key for a search."""
+        return (
+            " ".join(query.lower().split()),
+            strategy,
+            frozenset(adapter.get_name() for adapter in self.adapters),
+            config.signature(),
+        )
+
+    def _get_cached_results(
+        self, cache_key: Tuple, start_time: float
+    ) -> Optional[List[SearchResult]]:
+        """
+        Count a new search and return its cached results, if any.
+
+        Returns a copy of the cached list so callers may modify it, or None
+        on a cache miss or when the entry has expired.
+        """
+        with self._stats_lock:
+            self.search_stats["total_searches"] += 1
+
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                stored_at, results = cached
+                if time.monotonic() - stored_at >= self._cache_timeout():
+                    del self._result_cache[cache_key]
+                    cached = None
+
+            if cached is None:
+                self.search_stats["cache_misses"] += 1
+                return None
+
+            self._result_cache.move_to_end(cache_key)
+            self.search_stats["cache_hits"] += 1
+            self.search_stats["successful_searches"] += 1
+            self.search_stats["total_response_time"] += time.time() - start_time
+            return list(results)
+
+    @staticmethod
+    def _cache_timeout() -> float:
+        """Seconds a cached result stays fresh; 0 disables the cache."""
+        return getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", 0)
+
+    def _cache_results(self, cache_key: Tuple, results: List[SearchResult]) -> None:
+        """Store results in the LRU cache; caller must hold _stats_lock."""
+        # Empty result sets usually mean every adapter failed, so don't pin them
+        if not results or self.cache_size <= 0 or self._cache_timeout() <= 0:
+            return
+
+        self._result_cache[cache_key] = (time.monotonic(), list(results))
+        self._result_cache.move_to_end(cache_key)
+        while len(self._result_cache) > self.cache_size:
+            self._result_cache.popitem(last=False)
+
+    def _post_process_results(
+        self, results: List[SearchResult], query: str, config: SearchConfig
+    ) -> List[SearchResult]:
+        """Deduplicate, rank and truncate combined adapter results."""
+        if config.enable_deduplication:
+            # Unranked results are already in final order, so deduplication
+            # can stop as soon as enough unique results have been kept
+            limit = None if config.enable_ranking else config.max_total_results
+            results = self._deduplicate_results(results, limit)
+
+        if config.enable_ranking:
+            results = self.ranker.rank_results(
+                results, query, top_k=config.max_total_results
+            )
+
+        # Limit total results
+        return results[: config.max_total_results]
+
+    def _execute_parallel_search(
+        self,
+        query: str,
+        config: SearchConfig,
+        adapters: Optional[List[BaseSearchAdapter]] = None,
+    ) -> List[SearchResult]:
+        """Execute search across adapters (default: all loaded) in parallel."""
+        if adapters is None:
+            adapters = self.adapters
+        if not adapters:
+            return []
+
+        results = []
+
+        # Submit all search tasks to the shared pool
+        future_to_adapter = {}
+        for adapter in adapters:
+            call = AdapterCall()
+            future = self._executor.submit(
+                self._search_with_adapter, adapter, query, config, call
+            )
+            future_to_adapter[future] = (adapter, call)
+
+        # Wait for the adapters; those still running at the timeout are
+        # dropped (cancelled if not started yet, else left to the pool)
+        _, pending = concurrent.futures.wait(
+            future_to_adapter, timeout=config.timeout_seconds
+        )
+
+        for future, (adapter, call) in future_to_adapter.items():
+            if future in pending:
+                # Settling the call stops a late finish from counting again
+                future.cancel()
+                logger.warning("Adapter %s timed out", adapter.get_name())
+                self._update_adapter_stats(
+                    adapter.get_name(),
+                    success=False,
+                    search_time=config.timeout_seconds,
+                    call=call,
+                )
+                continue
+
+            try:
+                adapter_results = future.result()
+                results.extend(adapter_results)
+            except Exception as e:
+                # Already counted by _search_with_adapter
+                logger.warning("Adapter %s failed: %s", adapter.get_name(), e)
+
+        return results
+
+    async def _aexecute_parallel_search(
+        self,
+        query: str,
+        config: SearchConfig,
+        adapters: Optional[List[BaseSearchAdapter]] = None,
+    ) -> List[SearchResult]:
+        """Await adapters concurrently, each with its own timeout."""
+        if adapters is None:
+            adapters = self.adapters
+        if not adapters:
+            return []
+
+        # Adapters are blocking, so each search runs in a worker thread; the
+        # event loop only waits, and a timed-out adapter is simply dropped
+        calls = [AdapterCall() for _ in adapters]
+        outcomes = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    asyncio.to_thread(
+                        self._search_with_adapter, adapter, query, config, call
+                    ),
+                    timeout=config.timeout_seconds,
+                )
+                for adapter, call in zip(adapters, calls)
+            ),
+            return_exceptions=True,
+        )
+
+        results = []
+        for adapter, call, outcome in zip(adapters, calls, outcomes):
+            if isinstance(outcome, Exception):
+                # A call the worker already counted (including its own slot
+                # timeout) is settled, so this only records abandoned calls
+                logger.warning("Adapter %s failed: %r", adapter.get_name(), outcome)
+                self._update_adapter_stats(
+                    adapter.get_name(),
+                    success=False,
+                    search_time=config.timeout_seconds,
+                    call=call,
+                )
+            else:
+                results.extend(outcome)
 
         return results
 
     def _execute_sequential_search(
-        self, query: str, config: SearchConfig
+        self,
+        query: str,
+        config: SearchConfig,
+        adapters: Optional[List[BaseSearchAdapter]] = None,
     ) -> List[SearchResult]:
-        """Execute search across adapters sequentially."""
+        """Execute search across adapters (default: all loaded) sequentially."""
+        if adapters is None:
+            adapters = self.adapters
+
         results = []
 
-        for adapter in self.adapters:
+        for adapter in adapters:
             try:
                 adapter_results = self._search_with_adapter(adapter, query, config)
                 results.extend(adapter_results)
             except Exception as e:
-                print(f"Adapter {adapter.get_name()} failed: {e}")
-                self._update_adapter_stats(adapter.get_name(), success=False)
+                # Already counted by _search_with_adapter
+                logger.warning("Adapter %s failed: %s", adapter.get_name(), e)
 
         return results
 
@@ -312,53 +713,67 @@ class MetaSearchOrchestrator:
     ) -> List[SearchResult]:
         """Execute adaptive search starting with preferred adapters."""
         results = []
+        # Snapshot the list so a concurrent load_adapters() can't change it
+        adapters = self.adapters
 
         # Start with preferred adapters in parallel
-        preferred_adapters = [
-            a for a in self.adapters if a.get_name() in config.preferred_adapters
-        ]
+        preferred_names = frozenset(config.preferred_adapters)
+        preferred_adapters = [a for a in adapters if a.get_name() in preferred_names]
 
         if preferred_adapters:
             # Quick search with preferred adapters (shorter timeout)
-            quick_config = SearchConfig(
+            quick_config = replace(
+                config,
                 max_results_per_adapter=config.max_results_per_adapter // 2,
                 timeout_seconds=config.timeout_seconds // 2,
-                enable_deduplication=config.enable_deduplication,
                 enable_ranking=False,  # Rank at the end
             )
 
-            temp_adapters = self.adapters
-            self.adapters = preferred_adapters
-            preferred_results = self._execute_parallel_search(query, quick_config)
-            self.adapters = temp_adapters
+            preferred_results = self._execute_parallel_search(
+                query, quick_config, adapters=preferred_adapters
+            )
 
             results.extend(preferred_results)
 
         # If we need more results, try fallback adapters
         if len(results) < config.max_total_results // 2:
-            fallback_adapters = [
-                a for a in self.adapters if a.get_name() in config.fallback_adapters
-            ]
+            fallback_names = frozenset(config.fallback_adapters)
+            fallback_adapters = [a for a in adapters if a.get_name() in fallback_names]
 
             if fallback_adapters:
-                temp_adapters = self.adapters
-                self.adapters = fallback_adapters
-                fallback_results = self._execute_parallel_search(query, config)
-                self.adapters = temp_adapters
+                fallback_results = self._execute_parallel_search(
+                    query, config, adapters=fallback_adapters
+                )
 
                 results.extend(fallback_results)
 
         return results
 
     def _search_with_adapter(
-        self, adapter: BaseSearchAdapter, query: str, config: SearchConfig
+        self,
+        adapter: BaseSearchAdapter,
+        query: str,
+        config: SearchConfig,
+        call: Optional[AdapterCall] = None,
     ) -> List[SearchResult]:
-        """Execute search with a single adapter and track performance."""
+        """
+        Execute search with a single adapter and track performance.
+
+        Records the call's success or failure in the adapter statistics,
+        unless call was already settled by a caller that timed it out.
+        """
         adapter_name = adapter.get_name()
+        slots = adapter_slots(adapter)
         start_time = time.time()
 
         try:
-            results = adapter.search(query, limit=config.max_results_per_adapter)
+            # Wait for a free slot on this engine, within the search timeout
+            if not slots.acquire(timeout=config.timeout_seconds):
+                raise TimeoutError(f"No free {adapter_name} search slot")
+            try:
+                results = adapter.search(query, limit=config.max_results_per_adapter)
+            finally:
+                slots.release()
 
             # Filter results by quality
             filtered_results = [
@@ -367,7 +782,7 @@ class MetaSearchOrchestrator:
 
             search_time = time.time() - start_time
             self._update_adapter_stats(
-                adapter_name, success=True, search_time=search_time
+                adapter_name, success=True, search_time=search_time, call=call
             )
 
             return filtered_results
@@ -375,41 +790,57 @@ class MetaSearchOrchestrator:
         except Exception as e:
             search_time = time.time() - start_time
             self._update_adapter_stats(
-                adapter_name, success=False, search_time=search_time
+                adapter_name, success=False, search_time=search_time, call=call
             )
             raise e
 
-    def _deduplicate_results(self, results: List[SearchResult]) -> List[SearchResult]:
-        """Remove duplicate results based on URL canonicalization."""
-        if not results:
-            return []
+    def _deduplicate_results(
+        self, results: Iterable[SearchResult], limit: Optional[int] = None
+    ) -> List[SearchResult]:
+        """
+        Remove duplicate results based on URL canonicalization.
 
-        # Extract URLs for deduplication
-        urls = [r.url for r in results]
-        unique_urls = deduplicate_urls(urls)
+        Args:
+            results: Search results, in priority order
+            limit: Stop after this many unique results, or None for all
 
-        # Keep first occurrence of each unique URL
+        Returns:
+            First result for each canonical URL
+        """
+        # Keep first occurrence of each canonical URL
         seen_urls = set()
         unique_results = []
 
         for result in results:
-            if result.url in unique_urls and result.url not in seen_urls:
+            canonical = canonicalize_url(result.url)
+            if canonical not in seen_urls:
+                seen_urls.add(canonical)
                 unique_results.append(result)
-                seen_urls.add(result.url)
+                if limit is not None and len(unique_results) >= limit:
+                    break
 
         return unique_results
 
     def _update_adapter_stats(
-        self, adapter_name: str, success: bool, search_time: float = 0.0
+        self,
+        adapter_name: str,
+        success: bool,
+        search_time: float = 0.0,
+        call: Optional[AdapterCall] = None,
     ) -> None:
-        """Update performance statistics for an adapter."""
+        """Update performance statistics for an adapter, once per call."""
         with self._stats_lock:
+            if call is not None:
+                if call.settled:
+                    return
+                call.settled = True
+
             stats = self.search_stats["adapter_performance"][adapter_name]
-            stats["calls"] += 1
-            stats["total_time"] += search_time
+            stats[CALLS] += 1
+            stats[TOTAL_TIME] += search_time
 
             if success:
-                stats["successes"] += 1
+                stats[SUCCESSES] += 1
 
     def get_search_statistics(self) -> Dict[str, Any]:
         """Get comprehensive search performance statistics."""
@@ -430,11 +861,11 @@ class MetaSearchOrchestrator:
             # Adapter performance metrics
             adapter_metrics = {}
             for adapter_name, perf in stats["adapter_performance"].items():
-                calls = perf["calls"]
+                calls = int(perf[CALLS])
                 if calls > 0:
                     adapter_metrics[adapter_name] = {
-                        "success_rate": perf["successes"] / calls,
-                        "average_time": perf["total_time"] / calls,
+                        "success_rate": perf[SUCCESSES] / calls,
+                        "average_time": perf[TOTAL_TIME] / calls,
                         "total_calls": calls,
                     }
 
@@ -449,15 +880,22 @@ class MetaSearchOrchestrator:
     def reset_statistics(self) -> None:
         """Reset all performance statistics."""
         with self._stats_lock:
-            self.search_stats = {
-                "total_searches": 0,
-                "successful_searches": 0,
-                "failed_searches": 0,
-                "total_response_time": 0.0,
-                "adapter_performance": defaultdict(
-                    lambda: {"calls": 0, "successes": 0, "total_time": 0.0}
-                ),
-            }
+            self.search_stats = self._new_search_stats()
+
+    def clear_cache(self) -> None:
+        """Drop all cached search results."""
+        with self._stats_lock:
+            self._result_cache.clear()
+
+    def close(self) -> None:
+        """Release the worker threads used for parallel searches."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> "MetaSearchOrchestrator":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def get_available_adapters(self) -> List[str]:
         """Get list of currently loaded adapter names."""
@@ -490,10 +928,9 @@ def search_osint(
         enable_ranking=True,
     )
 
-    orchestrator = MetaSearchOrchestrator(config)
-    orchestrator.load_adapters(adapters)
-
-    return orchestrator.search(query, strategy=SearchStrategy.ADAPTIVE)
+    with MetaSearchOrchestrator(config) as orchestrator:
+        orchestrator.load_adapters(adapters)
+        return orchestrator.search(query, strategy=SearchStrategy.ADAPTIVE)
 
 
 def quick_search(query: str, adapter_name: str = "duckduckgo") -> List[SearchResult]:
@@ -507,7 +944,5 @@ def quick_search(query: str, adapter_name: str = "duckduckgo") -> List[SearchRes
     Returns:
         Search results from single adapter
     """
-    orchestrator = MetaSearchOrchestrator()
-    orchestrator.load_adapters([adapter_name])
-
-    return orchestrator.search(query, strategy=SearchStrategy.SEQUENTIAL)
+    with MetaSearchOrchestrator() as orchestrator:
+        return orchestrator.search_single(query, adapter_name)
@@ -1,7 +1,12 @@
 """Tests for search engine adapters."""
 
-from django.test import TestCase
+import asyncio
+import json
+import requests
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from unittest.mock import Mock, patch, MagicMock
+from apps.search import adapters
 from apps.search.adapters import (
     BaseSearchAdapter,
     GoogleSearchAdapter,
@@ -11,7 +16,9 @@ from apps.search.adapters import (
     CurlSearchAdapter,
     SearchAdapterFactory,
     SearchResult,
+    get_http_session,
 )
+from apps.search.utils import canonicalize_url
 
 
 class SearchResultTest(TestCase):
@@ -42,6 +49,32 @@ class SearchResultTest(TestCase):
         self.assertIn("https://example.com", repr_str)
         self.assertIn("google", repr_str)
 
+    def test_search_result_uses_slots(self):
+        """Test SearchResult instances carry no per-instance __dict__."""
+        result = SearchResult(
+            title="Test", url="https://example.com", snippet="", source="google"
+        )
+
+        self.assertFalse(hasattr(result, "__dict__"))
+        with self.assertRaises(AttributeError):
+            result.score = 1.0
+
+    def test_search_result_reuses_canonical_url_cache(self):
+        """Test repeated URLs across results hit the canonicalization cache."""
+        canonicalize_url.cache_clear()
+
+        for source in ("google", "bing", "duckduckgo"):
+            SearchResult(
+                title="Shared",
+                url="https://www.example.com/page?utm_source=x",
+                snippet="Snippet",
+                source=source,
+            )
+
+        info = canonicalize_url.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 2)
+
 
 class BaseSearchAdapterTest(TestCase):
     """Test cases for BaseSearchAdapter abstract class."""
@@ -57,6 +90,77 @@ class BaseSearchAdapterTest(TestCase):
         self.assertTrue(hasattr(BaseSearchAdapter, "search"))
         self.assertTrue(hasattr(BaseSearchAdapter, "get_name"))
 
+    def test_adapters_share_pooled_http_session(self):
+        """Test every adapter reuses one pooled HTTP session."""
+        google = GoogleSearchAdapter()
+        bing = BingSearchAdapter()
+
+        self.assertIs(google.session, bing.session)
+        self.assertIs(google.session, get_http_session())
+        pool = google.session.get_adapter("https://www.bing.com")
+        self.assertEqual(pool._pool_maxsize, 32)
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_fetch_page_caps_body_size(self, mock_get):
+        """Test result pages are streamed and cut off at MAX_PAGE_BYTES."""
+        chunk = b"x" * (64 * 1024)
+        chunks_read = []
+
+        def iter_content(chunk_size):
+            for _ in range(100):
+                chunks_read.append(chunk)
+                yield chunk
+
+        mock_response = Mock(encoding="utf-8")
+        mock_response.iter_content.side_effect = iter_content
+        mock_get.return_value = mock_response
+
+        page = DuckDuckGoSearchAdapter()._fetch_page("https://example.com")
+
+        self.assertEqual(len(page), adapters.MAX_PAGE_BYTES)
+        self.assertLess(len(chunks_read), 100)
+        self.assertTrue(mock_get.call_args.kwargs["stream"])
+        mock_response.close.assert_called_once()
+
+    def test_clean_text_decodes_entities_and_whitespace(self):
+        """Test _clean_text unescapes entities and collapses whitespace."""
+        adapter = DuckDuckGoSearchAdapter()
+
+        cleaned = adapter._clean_text(
+            "  Tom&nbsp;&amp;&nbsp;Jerry\n\t&lt;b&gt; &quot;quoted&quot; &#39;x&#39; "
+        )
+
+        self.assertEqual(cleaned, "Tom & Jerry <b> \"quoted\" 'x'")
+        self.assertEqual(adapter._clean_text(""), "")
+
+    def test_asearch_runs_search_concurrently(self):
+        """Test asearch awaits the blocking search for several adapters."""
+        adapters = [DuckDuckGoSearchAdapter(), BingSearchAdapter()]
+        expected = [
+            SearchResult(
+                title="Async Result",
+                url="https://example.com",
+                snippet="Snippet",
+                source="duckduckgo",
+            )
+        ]
+
+        async def search_all():
+            return await asyncio.gather(
+                *(adapter.asearch("test query", limit=5) for adapter in adapters)
+            )
+
+        with patch.object(
+            DuckDuckGoSearchAdapter, "search", return_value=expected
+        ) as mock_ddg, patch.object(
+            BingSearchAdapter, "search", return_value=[]
+        ) as mock_bing:
+            results = asyncio.run(search_all())
+
+        self.assertEqual(results, [expected, []])
+        mock_ddg.assert_called_once_with("test query", 5)
+        mock_bing.assert_called_once_with("test query", 5)
+
 
 class GoogleSearchAdapterTest(TestCase):
     """Test cases for Google search adapter."""
@@ -88,6 +192,7 @@ class GoogleSearchAdapterTest(TestCase):
                 },
             ]
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
 
         # Provide API credentials to use API path instead of scraping
@@ -107,9 +212,11 @@ class GoogleSearchAdapterTest(TestCase):
         """Test search with API error."""
         mock_get.side_effect = Exception("API Error")
 
-        results = self.adapter.search("test query")
+        with self.assertLogs("apps.search.adapters", "ERROR") as logs:
+            results = self.adapter.search("test query")
 
         self.assertEqual(len(results), 0)
+        self.assertIn("API Error", logs.output[0])
 
     @patch("apps.search.adapters.requests.Session.get")
     def test_search_no_results(self, mock_get):
@@ -117,12 +224,51 @@ class GoogleSearchAdapterTest(TestCase):
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {}
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
 
         results = self.adapter.search("test query")
 
         self.assertEqual(len(results), 0)
 
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_search_decodes_raw_bytes_with_orjson(self, mock_get):
+        """Test API responses are decoded from bytes when orjson is present."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"items": [{"title": "Fast", "link": "https://example.com"}]}
+        ).encode()
+        mock_get.return_value = mock_response
+        self.adapter.api_key = "test_key"
+        self.adapter.search_engine_id = "test_id"
+
+        fake_orjson = Mock(loads=Mock(side_effect=json.loads))
+        with patch("apps.search.adapters.orjson", fake_orjson):
+            results = self.adapter.search("test query")
+
+        self.assertEqual(len(results), 1)
+        fake_orjson.loads.assert_called_once_with(mock_response.content)
+        mock_response.json.assert_not_called()
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_scraping_unwraps_redirect_links(self, mock_get):
+        """Test Google /url?q= redirect links are resolved to their target."""
+        mock_response = Mock()
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [
+            b"""
+        <div class="g">
+            <a href="/url?q=https://example.com/page%3Fid%3D1&amp;sa=U"><h3>Result</h3></a>
+        </div>
+        """
+        ]
+        mock_get.return_value = mock_response
+
+        results = self.adapter._search_scraping("test query")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].url, "https://example.com/page?id=1")
+
 
 class BingSearchAdapterTest(TestCase):
     """Test cases for Bing search adapter."""
@@ -151,6 +297,7 @@ class BingSearchAdapterTest(TestCase):
                 ]
             }
         }
+        mock_response.content = json.dumps(mock_response.json.return_value).encode()
         mock_get.return_value = mock_response
 
         # Provide API key to use API path
@@ -179,12 +326,15 @@ class DuckDuckGoSearchAdapterTest(TestCase):
         """Test successful search operation."""
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = """
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [
+            b"""
         <div class="result">
             <a class="result__a" href="https://ddg1.com">DDG Result 1</a>
             <a class="result__snippet">DDG snippet 1</a>
         </div>
         """
+        ]
         mock_get.return_value = mock_response
 
         results = self.adapter.search("test query")
@@ -192,6 +342,58 @@ class DuckDuckGoSearchAdapterTest(TestCase):
         # DuckDuckGo parsing implementation will determine exact behavior
         self.assertIsInstance(results, list)
 
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_search_parses_results_inside_full_page(self, mock_get):
+        """Test results are found when wrapped in unrelated page markup."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [
+            b"""
+        <html><head><script>var x = "<div class='result'>";</script></head>
+        <body>
+            <div id="header"><a class="result__a" href="https://nav.com">Nav</a></div>
+            <div id="links">
+                <div class="result results_links web-result">
+                    <a class="result__a" href="https://ddg1.com">DDG Result 1</a>
+                    <a class="result__snippet">DDG snippet 1</a>
+                </div>
+            </div>
+        </body></html>
+        """
+        ]
+        mock_get.return_value = mock_response
+
+        results = self.adapter.search("test query")
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].title, "DDG Result 1")
+        self.assertEqual(results[0].snippet, "DDG snippet 1")
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_search_unwraps_redirect_links(self, mock_get):
+        """Test DuckDuckGo /l/?uddg= redirect links are resolved."""
+        mock_response = Mock()
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [
+            b"""
+        <div class="result">
+            <a class="result__a"
+               href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2Fa&amp;rut=abc">First</a>
+        </div>
+        <div class="result">
+            <a class="result__a" href="/l/?kh=-1&amp;uddg=https%3A%2F%2Fexample.org%2F">Second</a>
+        </div>
+        """
+        ]
+        mock_get.return_value = mock_response
+
+        results = self.adapter.search("test query")
+
+        self.assertEqual(
+            [r.url for r in results], ["https://example.com/a", "https://example.org/"]
+        )
+
 
 class LynxSearchAdapterTest(TestCase):
     """Test cases for Lynx search adapter."""
@@ -245,6 +447,31 @@ class LynxSearchAdapterTest(TestCase):
             results = self.adapter.search("test query")
             mock_fallback.assert_called_once()
 
+    @patch("apps.search.adapters.subprocess.run")
+    def test_query_is_url_encoded(self, mock_run):
+        """Test reserved characters in the query don't split the URL."""
+        self.adapter.lynx_available = True
+        mock_run.return_value = Mock(returncode=0, stdout="")
+
+        self.adapter.search("AT&T #1+2")
+
+        cmd = mock_run.call_args[0][0]
+        self.assertIn("?q=AT%26T+%231%2B2&s=0&dc=10", cmd[-1])
+
+    def test_fallback_reuses_duckduckgo_adapter(self):
+        """Test repeated fallbacks share one DuckDuckGo adapter and session."""
+        self.adapter.lynx_available = False
+
+        with patch.object(
+            DuckDuckGoSearchAdapter, "search", return_value=[]
+        ) as mock_search:
+            self.adapter.search("first query")
+            first_fallback = self.adapter._fallback_adapter
+            self.adapter.search("second query")
+
+        self.assertIs(self.adapter._fallback_adapter, first_fallback)
+        self.assertEqual(mock_search.call_count, 2)
+
 
 class CurlSearchAdapterTest(TestCase):
     """Test cases for Curl search adapter."""
@@ -262,6 +489,7 @@ class CurlSearchAdapterTest(TestCase):
     def test_search_success(self, mock_which, mock_run):
         """Test successful curl search."""
         mock_which.return_value = "/usr/bin/curl"
+        self.adapter.curl_available = True  # Opt in to the curl binary
         mock_result = Mock()
         mock_result.returncode = 0
         mock_result.stdout = """
@@ -277,19 +505,285 @@ class CurlSearchAdapterTest(TestCase):
         self.assertGreater(len(results), 0)
         mock_run.assert_called_once()
 
-    @patch("apps.search.adapters.shutil.which")
-    def test_curl_not_available(self, mock_which):
-        """Test when curl not available."""
-        mock_which.return_value = None
+    @patch("apps.search.adapters.subprocess.run")
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_curl_not_available_uses_http(self, mock_get, mock_run):
+        """Test the HTTP session is used when the curl binary is not."""
+        self.adapter.curl_available = False
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.encoding = "utf-8"
+        mock_response.iter_content.return_value = [
+            b"""
+        <div class="result">
+            <a class="result__a" href="https://example.com">Test Result</a>
+            <a class="result__snippet">Test snippet content</a>
+        </div>
+        """
+        ]
+        mock_get.return_value = mock_response
 
         results = self.adapter.search("test query")
 
-        self.assertEqual(len(results), 0)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].source, "curl")
+        mock_run.assert_not_called()
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_http_search_shares_duckduckgo_parser(self, mock_get):
+        """Test curl results honour the limit and unwrap DDG redirects."""
+        self.adapter.curl_available = False
+        row = (
+            '<div class="result"><a class="result__a" '
+            'href="/l/?uddg=https%3A%2F%2Fexample.com%2F{0}">Result {0}</a></div>'
+        )
+        mock_response = Mock(encoding="utf-8")
+        mock_response.iter_content.return_value = [
+            "".join(row.format(i) for i in range(15)).encode()
+        ]
+        mock_get.return_value = mock_response
+
+        results = self.adapter.search("test query", limit=12)
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(results[0].url, "https://example.com/0")
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_http_search_encodes_query(self, mock_get):
+        """Test reserved characters in the query don't split the URL."""
+        self.adapter.curl_available = False
+        mock_get.return_value = Mock(encoding="utf-8")
+        mock_get.return_value.iter_content.return_value = [b""]
+
+        self.adapter.search("AT&T #1+2", limit=5)
+
+        url = mock_get.call_args[0][0]
+        self.assertTrue(url.endswith("?q=AT%26T+%231%2B2&s=0&dc=5"))
+
+    def test_terminal_tools_are_opt_in(self):
+        """Test the curl binary is only used when explicitly enabled."""
+        with patch(
+            "apps.search.adapters.shutil.which", return_value="/usr/bin/curl"
+        ), patch.dict("os.environ", {"SEARCH_USE_TERMINAL_TOOLS": "false"}):
+            self.assertFalse(CurlSearchAdapter().curl_available)
+
+        with patch(
+            "apps.search.adapters.shutil.which", return_value="/usr/bin/curl"
+        ), patch.dict("os.environ", {"SEARCH_USE_TERMINAL_TOOLS": "true"}):
+            self.assertTrue(CurlSearchAdapter().curl_available)
+
+
+@override_settings(SEARCH_RESULT_CACHE_TIMEOUT=60)
+class SearchResultCacheTest(TestCase):
+    """Test cases for caching adapter search results."""
+
+    def setUp(self):
+        """Set up test environment."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = patch.object(adapters, "circuit_breaker", adapters.CircuitBreaker())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.adapter = DuckDuckGoSearchAdapter()
+        self.results = [
+            SearchResult(
+                title=f"Result {i}",
+                url=f"https://example.com/{i}",
+                snippet="Snippet",
+                source="duckduckgo",
+            )
+            for i in range(5)
+        ]
+
+    @patch.object(DuckDuckGoSearchAdapter, "_fetch_page", return_value="")
+    def test_repeat_query_is_served_from_cache(self, mock_fetch):
+        """Test a repeated query does not hit the network again."""
+        with patch.object(
+            DuckDuckGoSearchAdapter, "_parse_page", return_value=self.results
+        ):
+            first = self.adapter.search("cached query", limit=5)
+            second = self.adapter.search("cached query", limit=3)
+
+        self.assertEqual(mock_fetch.call_count, 1)
+        self.assertEqual(first, self.results)
+        self.assertEqual(second, self.results[:3])
+
+    @patch.object(DuckDuckGoSearchAdapter, "_fetch_page", return_value="")
+    def test_larger_limit_bypasses_cache(self, mock_fetch):
+        """Test asking for more results than were cached refetches."""
+        with patch.object(
+            DuckDuckGoSearchAdapter, "_parse_page", return_value=self.results
+        ):
+            self.adapter.search("cached query", limit=5)
+            self.adapter.search("cached query", limit=10)
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_empty_results_are_not_cached(self, mock_get):
+        """Test failed or empty searches are retried on the next call."""
+        mock_get.side_effect = Exception("Network error")
+
+        self.adapter.search("cached query")
+        self.adapter.search("cached query")
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=0)
+    @patch.object(DuckDuckGoSearchAdapter, "_fetch_page", return_value="")
+    def test_cache_can_be_disabled(self, mock_fetch):
+        """Test a zero timeout turns the cache off."""
+        with patch.object(
+            DuckDuckGoSearchAdapter, "_parse_page", return_value=self.results
+        ):
+            self.adapter.search("cached query")
+            self.adapter.search("cached query")
+
+        self.assertEqual(mock_fetch.call_count, 2)
+
+
+class CircuitBreakerTest(TestCase):
+    """Test cases for the per-engine circuit breaker."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.breaker = adapters.CircuitBreaker(threshold=3, window=60, cooldown=120)
+        self.clock = [1000.0]
+        patcher = patch(
+            "apps.search.adapters.time.monotonic", side_effect=lambda: self.clock[0]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_opens_after_threshold_failures(self):
+        """Test the circuit opens once failures reach the threshold."""
+        for _ in range(2):
+            self.breaker.record_failure("bing")
+        self.assertFalse(self.breaker.is_open("bing"))
+
+        self.breaker.record_failure("bing")
+
+        self.assertTrue(self.breaker.is_open("bing"))
+        self.assertFalse(self.breaker.is_open("google"))
+
+    def test_failures_outside_window_are_forgotten(self):
+        """Test old failures do not count towards the threshold."""
+        self.breaker.record_failure("bing")
+        self.breaker.record_failure("bing")
+        self.clock[0] += 61
+
+        self.breaker.record_failure("bing")
+
+        self.assertFalse(self.breaker.is_open("bing"))
+
+    def test_closes_after_cooldown_and_on_success(self):
+        """Test the circuit closes after the cooldown or a success."""
+        for _ in range(3):
+            self.breaker.record_failure("bing")
+        self.clock[0] += 121
+        self.assertFalse(self.breaker.is_open("bing"))
+
+        for _ in range(3):
+            self.breaker.record_failure("bing")
+        self.breaker.record_success("bing")
+        self.assertFalse(self.breaker.is_open("bing"))
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_get_records_only_transient_errors(self, mock_get):
+        """Test 5xx responses count as failures and 404s do not."""
+        adapter = BingSearchAdapter()
+
+        for status in (503, 404):
+            response = Mock(status_code=status)
+            response.raise_for_status.side_effect = requests.HTTPError(
+                response=response
+            )
+            mock_get.return_value = response
+            with patch.object(adapters, "circuit_breaker", self.breaker):
+                with self.assertRaises(requests.HTTPError):
+                    adapter._get("https://www.bing.com/search")
+
+        self.assertEqual(len(self.breaker._failures["bing"]), 1)
+
+    @patch("apps.search.adapters.requests.Session.get")
+    def test_search_skips_engine_with_open_circuit(self, mock_get):
+        """Test an open circuit returns no results without a request."""
+        for _ in range(3):
+            self.breaker.record_failure("duckduckgo")
+
+        with patch.object(adapters, "circuit_breaker", self.breaker):
+            results = DuckDuckGoSearchAdapter().search("test query")
+
+        self.assertEqual(results, [])
+        mock_get.assert_not_called()
+
+    def test_session_retries_transient_statuses(self):
+        """Test the shared session retries throttled and 5xx responses."""
+        retries = get_http_session().get_adapter("https://example.com").max_retries
+
+        self.assertEqual(retries.total, 2)
+        self.assertIn(429, retries.status_forcelist)
+        self.assertIn(503, retries.status_forcelist)
+
+
+class ResultPageParserTest(TestCase):
+    """Test cases for the top-level result page parsers."""
+
+    DDG_PAGE = """
+    <div class="result">
+        <a class="result__a" href="https://ddg1.com">DDG&nbsp;Result 1</a>
+        <a class="result__snippet">DDG snippet 1</a>
+    </div>
+    <div class="result">
+        <a class="result__a" href="https://ddg2.com">DDG Result 2</a>
+    </div>
+    """
+
+    def test_parsers_return_plain_rows(self):
+        """Test parsers return picklable (title, url, snippet) tuples."""
+        rows = adapters.parse_duckduckgo_html(self.DDG_PAGE, limit=10)
+
+        self.assertEqual(
+            rows,
+            [
+                ("DDG Result 1", "https://ddg1.com", "DDG snippet 1"),
+                ("DDG Result 2", "https://ddg2.com", ""),
+            ],
+        )
+        self.assertEqual(len(adapters.parse_duckduckgo_html(self.DDG_PAGE, 1)), 1)
+
+    def test_parser_processes_setting(self):
+        """Test SEARCH_PARSER_PROCESSES defaults to inline parsing."""
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertEqual(adapters.parser_processes(), 0)
+        with patch.dict("os.environ", {"SEARCH_PARSER_PROCESSES": "2"}):
+            self.assertEqual(adapters.parser_processes(), 2)
+        with patch.dict("os.environ", {"SEARCH_PARSER_PROCESSES": "many"}):
+            self.assertEqual(adapters.parser_processes(), 0)
+
+    def test_run_parser_in_process_pool(self):
+        """Test pages are parsed in a worker process when enabled."""
+        self.addCleanup(setattr, adapters, "_parser_pool", None)
+
+        with patch.dict("os.environ", {"SEARCH_PARSER_PROCESSES": "1"}):
+            rows = adapters.run_parser(
+                adapters.parse_duckduckgo_html, self.DDG_PAGE, 10
+            )
+            pool = adapters._parser_pool
+
+        pool.shutdown()
+        self.assertIsNotNone(pool)
+        self.assertEqual(rows, adapters.parse_duckduckgo_html(self.DDG_PAGE, 10))
 
 
 class SearchAdapterFactoryTest(TestCase):
     """Test cases for SearchAdapterFactory."""
 
+    def setUp(self):
+        """Set up test environment."""
+        SearchAdapterFactory.clear_cache()
+        self.addCleanup(SearchAdapterFactory.clear_cache)
+
     def test_get_adapter_google(self):
         """Test getting Google adapter."""
         adapter = SearchAdapterFactory.get_adapter("google")
@@ -315,6 +809,23 @@ class SearchAdapterFactoryTest(TestCase):
         adapter = SearchAdapterFactory.get_adapter("curl")
         self.assertIsInstance(adapter, CurlSearchAdapter)
 
+    def test_get_adapter_reuses_instances(self):
+        """Test adapters are built once per name and constructor arguments."""
+        first = SearchAdapterFactory.get_adapter("lynx")
+
+        with patch("apps.search.adapters.shutil.which") as mock_which:
+            second = SearchAdapterFactory.get_adapter("lynx")
+
+        self.assertIs(first, second)
+        mock_which.assert_not_called()
+        self.assertIsNot(
+            SearchAdapterFactory.get_adapter("bing", api_key="key"),
+            SearchAdapterFactory.get_adapter("bing"),
+        )
+
+        SearchAdapterFactory.clear_cache()
+        self.assertIsNot(SearchAdapterFactory.get_adapter("lynx"), first)
+
     def test_get_adapter_invalid(self):
         """Test getting invalid adapter raises error."""
         with self.assertRaises(ValueError):
@@ -380,6 +891,7 @@ class SearchAdapterIntegrationTest(TestCase):
                     }
                 ]
             }
+            mock_response.content = json.dumps(mock_response.json.return_value).encode()
             mock_get.return_value = mock_response
 
             results = adapter.search("test query")
@@ -4,7 +4,8 @@ from django.test import TestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from apps.subjects.models import Subject
-from apps.search.models import SearchQuery, SearchResult
+from apps.search.adapters import SearchResult as AdapterResult
+from apps.search.models import QueryType, SearchQuery, SearchResult
 
 
 class SearchQueryModelTest(TestCase):
@@ -19,11 +20,13 @@ class SearchQueryModelTest(TestCase):
     def test_create_search_query(self):
         """Test creating a search query."""
         query = SearchQuery.objects.create(
-            query_text="test search query", query_type="general", subject=self.subject
+            query_text="test search query",
+            query_type=QueryType.GENERAL,
+            subject=self.subject,
         )
 
         self.assertEqual(query.query_text, "test search query")
-        self.assertEqual(query.query_type, "general")
+        self.assertEqual(query.query_type, QueryType.GENERAL)
         self.assertEqual(query.subject, self.subject)
         self.assertIsNotNone(query.created_at)
 
@@ -31,7 +34,7 @@ class SearchQueryModelTest(TestCase):
         """Test string representation of SearchQuery."""
         query = SearchQuery.objects.create(
             query_text="This is a very long search query that should be truncated",
-            query_type="person",
+            query_type=QueryType.PERSON,
             subject=self.subject,
         )
 
@@ -41,11 +44,13 @@ class SearchQueryModelTest(TestCase):
     def test_search_query_ordering(self):
         """Test that search queries are ordered by creation date descending."""
         query1 = SearchQuery.objects.create(
-            query_text="First query", query_type="general", subject=self.subject
+            query_text="First query", query_type=QueryType.GENERAL, subject=self.subject
         )
 
         query2 = SearchQuery.objects.create(
-            query_text="Second query", query_type="general", subject=self.subject
+            query_text="Second query",
+            query_type=QueryType.GENERAL,
+            subject=self.subject,
         )
 
         queries = list(SearchQuery.objects.all())
@@ -54,16 +59,23 @@ class SearchQueryModelTest(TestCase):
 
     def test_search_query_types(self):
         """Test all valid search query types."""
-        valid_types = ["general", "person", "organization", "domain", "email"]
-
-        for query_type in valid_types:
+        for query_type in QueryType:
             query = SearchQuery.objects.create(
-                query_text=f"test {query_type} query",
+                query_text=f"test {query_type.label} query",
                 query_type=query_type,
                 subject=self.subject,
             )
+            query.refresh_from_db()
             self.assertEqual(query.query_type, query_type)
 
+    def test_search_query_type_defaults_to_general(self):
+        """Test query_type is stored as a small integer defaulting to general."""
+        query = SearchQuery.objects.create(query_text="q", subject=self.subject)
+        query.refresh_from_db()
+
+        self.assertEqual(query.query_type, QueryType.GENERAL)
+        self.assertEqual(query.get_query_type_display(), "General Search")
+
 
 class SearchResultModelTest(TestCase):
     """Test cases for SearchResult model."""
@@ -75,7 +87,7 @@ class SearchResultModelTest(TestCase):
         )
 
         self.query = SearchQuery.objects.create(
-            query_text="test search", query_type="general", subject=self.subject
+            query_text="test search", query_type=QueryType.GENERAL, subject=self.subject
         )
 
     def test_create_search_result(self):
@@ -201,3 +213,38 @@ class SearchResultModelTest(TestCase):
         # Result should be deleted due to CASCADE
         with self.assertRaises(SearchResult.DoesNotExist):
             SearchResult.objects.get(id=result_id)
+
+    def test_bulk_create_from_results(self):
+        """Test adapter results are stored in one batch and ranked in order."""
+        results = [
+            AdapterResult(
+                title="First",
+                url="https://www.example.com/a?utm_source=x",
+                snippet="Snippet A",
+                source="google",
+            ),
+            AdapterResult(
+                title="Second", url="https://example.com/b", snippet="", source="bing"
+            ),
+        ]
+
+        with self.assertNumQueries(1):
+            SearchResult.objects.bulk_create_from_results(self.query, results)
+
+        stored = list(self.query.results.all())
+        self.assertEqual([r.title for r in stored], ["First", "Second"])
+        self.assertEqual([r.rank for r in stored], [1, 2])
+        self.assertEqual(stored[0].canonical_url, "https://example.com/a")
+        self.assertEqual(stored[0].description, "Snippet A")
+        self.assertEqual(stored[1].search_engine, "bing")
+
+    def test_bulk_create_from_results_skips_existing_rows(self):
+        """Test rows violating the unique constraint are skipped, not raised."""
+        result = AdapterResult(
+            title="Repeat", url="https://example.com/", snippet="", source="google"
+        )
+        SearchResult.objects.bulk_create_from_results(self.query, [result])
+
+        SearchResult.objects.bulk_create_from_results(self.query, [result, result])
+
+        self.assertEqual(self.query.results.count(), 1)
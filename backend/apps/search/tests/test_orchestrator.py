@@ -1,15 +1,22 @@
 """Tests for meta-search orchestration service."""
 
-from django.test import TestCase
+import asyncio
+import threading
+import time
+from django.test import TestCase, override_settings
 from unittest.mock import Mock, patch, MagicMock
 from apps.search.orchestrator import (
+    CALLS,
+    SUCCESSES,
     MetaSearchOrchestrator,
     SearchStrategy,
     ResultRanker,
     SearchConfig,
     SearchResult,
+    domain_authority,
+    tokenize,
 )
-from apps.search.adapters import SearchResult
+from apps.search.adapters import BaseSearchAdapter, SearchResult
 
 
 class SearchConfigTest(TestCase):
@@ -113,6 +120,65 @@ class ResultRankerTest(TestCase):
         ranked = self.ranker.rank_results([], "test query")
         self.assertEqual(len(ranked), 0)
 
+    def test_tied_scores_keep_input_order(self):
+        """Test results with equal scores are ranked stably."""
+        results = [
+            SearchResult("Same", "https://example.com/a", "Same snippet", "google"),
+            SearchResult("Same", "https://example.com/b", "Same snippet", "google"),
+        ]
+
+        ranked = self.ranker.rank_results(results, "same")
+
+        self.assertEqual(ranked, results)
+
+    def test_top_k_matches_full_ranking_prefix(self):
+        """Test a partial top-k ranking equals the head of a full ranking."""
+        results = [
+            SearchResult(
+                f"Python {'guide ' * (i % 4)}", f"https://e{i}.com", "S", "bing"
+            )
+            for i in range(12)
+        ]
+
+        full = self.ranker.rank_results(results, "python guide")
+        top = self.ranker.rank_results(results, "python guide", top_k=5)
+
+        self.assertEqual(top, full[:5])
+
+    def test_tokenize_is_memoized(self):
+        """Test result text is tokenized once per distinct string."""
+        tokenize.cache_clear()
+        results = [
+            SearchResult("Python Guide", "https://a.com", "Learn Python", "bing"),
+            SearchResult("Python Guide", "https://b.com", "Learn Python", "google"),
+        ]
+
+        self.ranker.rank_results(results, "python")
+        self.ranker.rank_results(results, "python")
+
+        self.assertEqual(tokenize("Python  Guide"), frozenset({"python", "guide"}))
+        info = tokenize.cache_info()
+        self.assertEqual(info.misses, 4)  # query, title, snippet, "Python  Guide"
+
+    def test_domain_authority(self):
+        """Test domain indicators are checked in priority order."""
+        self.assertEqual(domain_authority("https://www.NASA.gov/"), 0.95)
+        self.assertEqual(domain_authority("https://en.wikipedia.org/wiki/X"), 0.8)
+        self.assertEqual(domain_authority("https://github.com/x"), 0.8)
+        self.assertEqual(domain_authority("https://example.com/"), 0.5)
+
+    def test_score_components(self):
+        """Test the weighted score of a single result."""
+        result = SearchResult(
+            "Python guide", "https://x.org/" + "a" * 36, "b" * 100, "bing"
+        )
+
+        (score,) = self.ranker._score_results([result], {"python", "tutorial"})
+
+        # title 1/2 * 0.3 + url 0.5 * 0.15 + source 0.85 * 0.15
+        # + content 0.5 * 0.1 + domain 0.8 * 0.05
+        self.assertAlmostEqual(score, 0.15 + 0.075 + 0.1275 + 0.05 + 0.04)
+
 
 class MetaSearchOrchestratorTest(TestCase):
     """Test cases for MetaSearchOrchestrator."""
@@ -121,6 +187,10 @@ class MetaSearchOrchestratorTest(TestCase):
         """Set up test environment."""
         self.orchestrator = MetaSearchOrchestrator()
 
+    def tearDown(self):
+        """Release the orchestrator's worker threads."""
+        self.orchestrator.close()
+
     def test_initialization(self):
         """Test orchestrator initialization."""
         self.assertIsNotNone(self.orchestrator.config)
@@ -253,6 +323,30 @@ class MetaSearchOrchestratorTest(TestCase):
         urls = [r.url for r in results]
         self.assertEqual(len(set(urls)), len(urls))  # All URLs should be unique
 
+    def test_deduplicate_results_keeps_first_canonical_url(self):
+        """Test duplicates are detected by canonical URL in input order."""
+        first = SearchResult("A", "https://example.com/page", "One", "google")
+        second = SearchResult("B", "https://other.com", "Two", "bing")
+        duplicate = SearchResult("C", "https://EXAMPLE.com/page/", "Three", "bing")
+
+        unique = self.orchestrator._deduplicate_results([first, second, duplicate])
+
+        self.assertEqual(unique, [first, second])
+
+    def test_deduplicate_results_stops_at_limit(self):
+        """Test deduplication consumes only as much input as it needs."""
+        consumed = []
+
+        def stream():
+            for i in range(100):
+                consumed.append(i)
+                yield SearchResult(f"R{i}", f"https://e.com/{i // 2}", "S", "bing")
+
+        unique = self.orchestrator._deduplicate_results(stream(), limit=3)
+
+        self.assertEqual([r.title for r in unique], ["R0", "R2", "R4"])
+        self.assertEqual(len(consumed), 5)
+
     @patch("apps.search.orchestrator.SearchAdapterFactory.get_adapter")
     def test_error_handling(self, mock_get_adapter):
         """Test error handling in search execution."""
@@ -319,6 +413,388 @@ class MetaSearchOrchestratorTest(TestCase):
         # Should get results from both adapters
         self.assertGreaterEqual(len(results), 1)
 
+    def _snippet_result(self, title, url, source):
+        """Build a result whose snippet passes the quality filter."""
+        return SearchResult(
+            title,
+            url,
+            "This is a comprehensive snippet with enough content to pass quality filters",
+            source,
+        )
+
+    def test_adapter_failure_is_logged(self):
+        """Test adapter errors go to the module logger."""
+        adapter = Mock()
+        adapter.get_name.return_value = "bing"
+        adapter.search.side_effect = Exception("quota exceeded")
+        self.orchestrator.adapters = [adapter]
+
+        with self.assertLogs("apps.search.orchestrator", "WARNING") as logs:
+            self.orchestrator.search("test query", strategy=SearchStrategy.SEQUENTIAL)
+
+        self.assertIn("Adapter bing failed: quota exceeded", logs.output[0])
+
+    def test_failed_adapter_call_counted_once(self):
+        """Test an adapter error is recorded once per call."""
+        adapter = Mock()
+        adapter.get_name.return_value = "bing"
+        adapter.search.side_effect = Exception("down")
+        self.orchestrator.adapters = [adapter]
+
+        for strategy in (SearchStrategy.PARALLEL, SearchStrategy.SEQUENTIAL):
+            self.orchestrator.search("test query", strategy=strategy)
+
+        perf = self.orchestrator.get_search_statistics()["adapter_performance"]
+        self.assertEqual(perf["bing"]["total_calls"], 2)
+
+    def test_adaptive_search_leaves_adapters_untouched(self):
+        """Test adaptive phases never swap the shared adapter list."""
+        loaded = []
+        adapters = []
+        for name in ("duckduckgo", "google"):
+            adapter = Mock()
+            adapter.get_name.return_value = name
+
+            def search(query, limit, name=name):
+                # Record what a concurrent caller would see mid-search
+                loaded.append(list(self.orchestrator.adapters))
+                return [self._snippet_result(name, f"https://{name}.com", name)]
+
+            adapter.search.side_effect = search
+            adapters.append(adapter)
+        self.orchestrator.adapters = adapters
+
+        results = self.orchestrator.search(
+            "test query", strategy=SearchStrategy.ADAPTIVE
+        )
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(loaded, [adapters, adapters])
+        self.assertIs(self.orchestrator.adapters, adapters)
+
+    def test_parallel_search_reuses_worker_threads(self):
+        """Test parallel searches run on the orchestrator's shared pool."""
+        threads = []
+        adapter = Mock()
+        adapter.get_name.return_value = "duckduckgo"
+        adapter.search.side_effect = lambda query, limit: threads.append(
+            threading.current_thread().name
+        )
+        self.orchestrator.adapters = [adapter]
+
+        with patch(
+            "apps.search.orchestrator.concurrent.futures.ThreadPoolExecutor"
+        ) as mock_pool:
+            for query in ("one", "two", "three"):
+                self.orchestrator.search(query)
+
+        mock_pool.assert_not_called()
+        self.assertEqual(len(threads), 3)
+        self.assertTrue(all(name.startswith("meta-search") for name in threads))
+
+    def test_parallel_search_drops_adapter_that_times_out(self):
+        """Test a slow adapter no longer fails the whole parallel search."""
+        fast = Mock()
+        fast.get_name.return_value = "duckduckgo"
+        fast.search.return_value = [
+            self._snippet_result("Fast", "https://fast.com", "duckduckgo")
+        ]
+        slow = Mock()
+        slow.get_name.return_value = "google"
+        slow.search.side_effect = lambda query, limit: time.sleep(0.3) or []
+        self.orchestrator.adapters = [fast, slow]
+
+        results = self.orchestrator.search(
+            "test query", config=SearchConfig(timeout_seconds=0.05)
+        )
+
+        self.assertEqual([r.source for r in results], ["duckduckgo"])
+
+        # Once the abandoned thread has finished, the call still counts once
+        self.orchestrator._executor.shutdown(wait=True)
+        perf = self.orchestrator.get_search_statistics()["adapter_performance"]
+        self.assertEqual(perf["google"]["total_calls"], 1)
+        self.assertEqual(perf["google"]["success_rate"], 0.0)
+
+    def test_adaptive_quick_phase_keeps_config_settings(self):
+        """Test the preferred-adapter phase inherits the caller's filters."""
+        adapter = Mock()
+        adapter.get_name.return_value = "duckduckgo"
+        adapter.search.return_value = [
+            SearchResult("Short", "https://short.com", "Tiny", "duckduckgo")
+        ]
+        self.orchestrator.adapters = [adapter]
+        config = SearchConfig(max_results_per_adapter=8, min_snippet_length=0)
+
+        results = self.orchestrator.search(
+            "test query", strategy=SearchStrategy.ADAPTIVE, config=config
+        )
+
+        self.assertEqual(len(results), 1)
+        adapter.search.assert_called_once_with("test query", limit=4)
+
+    def test_asearch_parallel(self):
+        """Test asearch awaits all adapters and merges their results."""
+        adapters = []
+        for name in ("duckduckgo", "google"):
+            adapter = Mock()
+            adapter.get_name.return_value = name
+            adapter.search.return_value = [
+                self._snippet_result(name, f"https://{name}.example.com", name)
+            ]
+            adapters.append(adapter)
+        self.orchestrator.adapters = adapters
+
+        results = asyncio.run(self.orchestrator.asearch("test query"))
+
+        self.assertEqual(sorted(r.source for r in results), ["duckduckgo", "google"])
+        self.assertEqual(self.orchestrator.search_stats["successful_searches"], 1)
+
+    def test_asearch_drops_adapter_that_times_out(self):
+        """Test a slow adapter times out without failing the whole search."""
+        fast = Mock()
+        fast.get_name.return_value = "duckduckgo"
+        fast.search.return_value = [
+            self._snippet_result("Fast", "https://fast.com", "duckduckgo")
+        ]
+
+        slow = Mock()
+        slow.get_name.return_value = "google"
+        slow.search.side_effect = lambda query, limit: time.sleep(0.3) or []
+
+        self.orchestrator.adapters = [fast, slow]
+        config = SearchConfig(timeout_seconds=0.05)
+
+        results = asyncio.run(self.orchestrator.asearch("test query", config=config))
+
+        self.assertEqual([r.source for r in results], ["duckduckgo"])
+        # asyncio.run() waits for the abandoned thread, whose late finish
+        # must not count the call a second time
+        stats = self.orchestrator.search_stats["adapter_performance"]["google"]
+        self.assertEqual(stats[CALLS], 1)
+        self.assertEqual(stats[SUCCESSES], 0)
+
+    def test_asearch_failed_adapter_counted_once(self):
+        """Test an adapter error is not counted again by asearch."""
+        adapter = Mock()
+        adapter.get_name.return_value = "bing"
+        adapter.search.side_effect = TimeoutError("No free bing search slot")
+        self.orchestrator.adapters = [adapter]
+
+        asyncio.run(self.orchestrator.asearch("test query"))
+
+        stats = self.orchestrator.search_stats["adapter_performance"]["bing"]
+        self.assertEqual(stats[CALLS], 1)
+
+    def test_asearch_other_strategies_use_search(self):
+        """Test non-parallel strategies run the synchronous search."""
+        with patch.object(self.orchestrator, "search", return_value=[]) as mock_search:
+            asyncio.run(
+                self.orchestrator.asearch(
+                    "test query", strategy=SearchStrategy.SEQUENTIAL
+                )
+            )
+
+        mock_search.assert_called_once_with(
+            "test query", SearchStrategy.SEQUENTIAL, None
+        )
+
+    def _caching_adapter(self):
+        """Build an adapter mock that returns one quality result."""
+        adapter = Mock()
+        adapter.get_name.return_value = "duckduckgo"
+        adapter.search.return_value = [
+            self._snippet_result("Result", "https://example.com", "duckduckgo")
+        ]
+        return adapter
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=900)
+    def test_repeated_query_served_from_cache(self):
+        """Test an identical search is answered without calling adapters."""
+        adapter = self._caching_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        first = self.orchestrator.search("OSINT  Tools")
+        second = self.orchestrator.search("osint tools ")
+
+        self.assertEqual(adapter.search.call_count, 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        stats = self.orchestrator.get_search_statistics()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["cache_misses"], 1)
+        self.assertEqual(stats["successful_searches"], 2)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=60)
+    def test_cached_results_expire(self):
+        """Test entries older than SEARCH_RESULT_CACHE_TIMEOUT are refetched."""
+        adapter = self._caching_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        with patch("apps.search.orchestrator.time.monotonic") as mock_clock:
+            mock_clock.return_value = 1000.0
+            self.orchestrator.search("test query")
+
+            mock_clock.return_value = 1059.0
+            self.orchestrator.search("test query")
+            self.assertEqual(adapter.search.call_count, 1)
+
+            mock_clock.return_value = 1060.0
+            self.orchestrator.search("test query")
+
+        self.assertEqual(adapter.search.call_count, 2)
+        stats = self.orchestrator.get_search_statistics()
+        self.assertEqual(stats["cache_hits"], 1)
+        self.assertEqual(stats["cache_misses"], 2)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=0)
+    def test_cache_disabled_without_timeout(self):
+        """Test a zero timeout turns the result cache off."""
+        adapter = self._caching_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        self.orchestrator.search("test query")
+        self.orchestrator.search("test query")
+
+        self.assertEqual(adapter.search.call_count, 2)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=900)
+    def test_cache_key_includes_strategy_and_config(self):
+        """Test a different strategy or config misses the cache."""
+        adapter = self._caching_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        self.orchestrator.search("test query")
+        self.orchestrator.search("test query", strategy=SearchStrategy.SEQUENTIAL)
+        self.orchestrator.search("test query", config=SearchConfig(max_total_results=5))
+
+        self.assertEqual(adapter.search.call_count, 3)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=900)
+    def test_cache_evicts_least_recently_used(self):
+        """Test the result cache is bounded."""
+        orchestrator = self.orchestrator
+        orchestrator.cache_size = 2
+        adapter = self._caching_adapter()
+        orchestrator.adapters = [adapter]
+
+        orchestrator.search("first")
+        orchestrator.search("second")
+        orchestrator.search("first")
+        orchestrator.search("third")
+        orchestrator.search("first")
+        orchestrator.search("second")
+
+        self.assertEqual(adapter.search.call_count, 4)
+        self.assertEqual(len(orchestrator._result_cache), 2)
+
+    @override_settings(SEARCH_RESULT_CACHE_TIMEOUT=900)
+    def test_empty_results_not_cached(self):
+        """Test failed searches are retried rather than cached."""
+        adapter = self._caching_adapter()
+        adapter.search.side_effect = [Exception("down"), adapter.search.return_value]
+        self.orchestrator.adapters = [adapter]
+
+        self.assertEqual(self.orchestrator.search("test query"), [])
+        self.assertEqual(len(self.orchestrator.search("test query")), 1)
+
+    def _echo_adapter(self):
+        """Build an adapter mock returning one result named after the query."""
+        adapter = Mock()
+        adapter.get_name.return_value = "duckduckgo"
+        adapter.search.side_effect = lambda query, limit: [
+            self._snippet_result(query, f"https://example.com/{query}", "duckduckgo")
+        ]
+        return adapter
+
+    @patch("apps.search.orchestrator.SearchAdapterFactory.get_adapter")
+    def test_search_single(self, mock_get_adapter):
+        """Test the single-adapter fast path filters, ranks and counts."""
+        adapter = Mock()
+        adapter.get_name.return_value = "duckduckgo"
+        adapter.search.return_value = [
+            self._snippet_result("Other", "https://a.com", "duckduckgo"),
+            SearchResult("Short", "https://b.com", "Too short", "duckduckgo"),
+            self._snippet_result("Query match", "https://c.com", "duckduckgo"),
+        ]
+        mock_get_adapter.return_value = adapter
+
+        results = self.orchestrator.search_single("match", "duckduckgo", limit=3)
+
+        adapter.search.assert_called_once_with("match", limit=3)
+        self.assertEqual([r.title for r in results], ["Query match", "Other"])
+        stats = self.orchestrator.get_search_statistics()
+        self.assertEqual(stats["successful_searches"], 1)
+        self.assertEqual(stats["adapter_performance"]["duckduckgo"]["total_calls"], 1)
+
+    def test_search_single_unknown_adapter(self):
+        """Test an unknown adapter fails the search without raising."""
+        with self.assertLogs("apps.search.orchestrator", "ERROR"):
+            results = self.orchestrator.search_single("query", "nonexistent")
+
+        self.assertEqual(results, [])
+        self.assertEqual(self.orchestrator.search_stats["failed_searches"], 1)
+
+    def test_search_batch(self):
+        """Test a batch returns results per query and runs repeats once."""
+        adapter = self._echo_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        batch = self.orchestrator.search_batch(["alpha", "beta", "alpha"])
+
+        self.assertEqual(list(batch), ["alpha", "beta"])
+        self.assertEqual(batch["beta"][0].title, "beta")
+        self.assertEqual(adapter.search.call_count, 2)
+
+    def test_asearch_batch(self):
+        """Test the async batch runs each query through asearch."""
+        adapter = self._echo_adapter()
+        self.orchestrator.adapters = [adapter]
+
+        batch = asyncio.run(
+            self.orchestrator.asearch_batch(["alpha", "beta"], max_concurrent_queries=1)
+        )
+
+        self.assertEqual(
+            {q: r[0].title for q, r in batch.items()},
+            {
+                "alpha": "alpha",
+                "beta": "beta",
+            },
+        )
+        self.assertEqual(self.orchestrator.search_stats["total_searches"], 2)
+
+    def test_adapter_concurrency_is_bounded(self):
+        """Test concurrent searches respect the adapter's max_concurrency."""
+
+        class ThrottledAdapter(BaseSearchAdapter):
+            max_concurrency = 1
+            active = peak = 0
+            lock = threading.Lock()
+
+            def get_name(self):
+                return "throttled-test"
+
+            def search(self, query, limit=10):
+                cls = type(self)
+                with cls.lock:
+                    cls.active += 1
+                    cls.peak = max(cls.peak, cls.active)
+                time.sleep(0.02)
+                with cls.lock:
+                    cls.active -= 1
+                return []
+
+        self.orchestrator.adapters = [ThrottledAdapter()]
+
+        self.orchestrator.search_batch(["a", "b", "c", "d"], max_concurrent_queries=4)
+
+        self.assertEqual(ThrottledAdapter.peak, 1)
+
+    def test_search_batch_empty(self):
+        """Test an empty batch does no work."""
+        self.assertEqual(self.orchestrator.search_batch([]), {})
+
     def test_get_search_statistics(self):
         """Test search statistics collection."""
         stats = self.orchestrator.get_search_statistics()
@@ -327,6 +803,8 @@ class MetaSearchOrchestratorTest(TestCase):
             "total_searches",
             "successful_searches",
             "failed_searches",
+            "cache_hits",
+            "cache_misses",
             "average_response_time",
             "adapter_performance",
         ]
@@ -334,6 +812,18 @@ class MetaSearchOrchestratorTest(TestCase):
         for key in expected_keys:
             self.assertIn(key, stats)
 
+    def test_adapter_performance_statistics(self):
+        """Test per-adapter counters are summarized in the statistics."""
+        self.orchestrator._update_adapter_stats("bing", True, search_time=1.0)
+        self.orchestrator._update_adapter_stats("bing", False, search_time=3.0)
+
+        perf = self.orchestrator.get_search_statistics()["adapter_performance"]
+
+        self.assertEqual(
+            perf,
+            {"bing": {"success_rate": 0.5, "average_time": 2.0, "total_calls": 2}},
+        )
+
     def test_configure_orchestrator(self):
         """Test orchestrator configuration."""
         new_config = SearchConfig(max_results_per_adapter=5, timeout_seconds=15)
@@ -347,6 +837,22 @@ class MetaSearchOrchestratorTest(TestCase):
 class MetaSearchIntegrationTest(TestCase):
     """Integration tests for meta-search functionality."""
 
+    def test_orchestrators_share_adapter_instances(self):
+        """Test fresh orchestrators reuse the factory's cached adapters."""
+        with MetaSearchOrchestrator() as first, MetaSearchOrchestrator() as second:
+            first.load_adapters(["duckduckgo"])
+            second.load_adapters(["duckduckgo"])
+
+            self.assertIs(first.adapters[0], second.adapters[0])
+
+    def test_context_manager_closes_worker_pool(self):
+        """Test leaving a with block shuts the orchestrator's pool down."""
+        with MetaSearchOrchestrator() as orchestrator:
+            pass
+
+        with self.assertRaises(RuntimeError):
+            orchestrator._executor.submit(print)
+
     def test_end_to_end_search(self):
         """Test complete search workflow."""
         orchestrator = MetaSearchOrchestrator()
@@ -4,6 +4,7 @@ from django.test import TestCase
 from apps.search.utils import (
     URLCanonicalizer,
     canonicalize_url,
+    canonicalize_urls,
     extract_domain,
     deduplicate_urls,
 )
@@ -303,6 +304,49 @@ class UtilityFunctionTest(TestCase):
         canonical = canonicalize_url(url)
         self.assertEqual(canonical, "https://example.com/path")
 
+    def test_canonicalize_url_function_is_cached(self):
+        """Test canonicalize_url memoizes repeated URLs."""
+        canonicalize_url.cache_clear()
+        url = "https://www.example.com/cached?utm_source=test"
+
+        first = canonicalize_url(url)
+        second = canonicalize_url(url)
+
+        self.assertEqual(first, second)
+        info = canonicalize_url.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+        # Options are part of the cache key
+        self.assertNotEqual(canonicalize_url(url, normalize_domain=False), first)
+
+    def test_canonicalize_url_function_invalid_input(self):
+        """Test canonicalize_url returns empty string for non-string input."""
+        self.assertEqual(canonicalize_url(None), "")
+        self.assertEqual(canonicalize_url(["https://example.com"]), "")
+        self.assertEqual(canonicalize_url({"url": "https://example.com"}), "")
+
+    def test_canonicalize_urls_function(self):
+        """Test batch canonicalization preserves order and duplicates."""
+        urls = [
+            "https://www.example.com/page?utm_source=test",
+            "https://different.com/page/",
+            "https://www.example.com/page?utm_source=test",
+        ]
+
+        canonical = canonicalize_urls(urls)
+
+        self.assertEqual(
+            canonical,
+            [
+                "https://example.com/page",
+                "https://different.com/page",
+                "https://example.com/page",
+            ],
+        )
+        self.assertEqual(canonicalize_urls([]), [])
+        self.assertEqual(canonicalize_urls([None, ["https://example.com"]]), ["", ""])
+
     def test_extract_domain_function(self):
         """Test extract_domain convenience function."""
         url = "https://www.example.com/path"
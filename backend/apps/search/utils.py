@@ -7,82 +7,95 @@ consistent handling across different search engines and data sources.
 
 import re
 import urllib.parse
+from functools import lru_cache
 from typing import Optional, Dict, List
 from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
 
 
+# Common URL parameters to remove during canonicalization
+_TRACKING_PARAMS = frozenset(
+    {
+        # Google Analytics and tracking
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "utm_id",
+        "utm_source_platform",
+        "utm_creative_format",
+        "utm_marketing_tactic",
+        # Facebook tracking
+        "fbclid",
+        "fb_action_ids",
+        "fb_action_types",
+        "fb_ref",
+        "fb_source",
+        # Twitter tracking
+        "ref_src",
+        "ref_url",
+        "twclid",
+        # Other common tracking parameters
+        "gclid",
+        "gclsrc",
+        "dclid",
+        "zanpid",
+        "ranMID",
+        "ranEAID",
+        "ranSiteID",
+        "spm",
+        "_hsenc",
+        "_hsmi",
+        "hsctatracking",
+        "mc_cid",
+        "mc_eid",
+        "pk_campaign",
+        "pk_kwd",
+        "pk_medium",
+        "pk_source",
+        # Session and reference tracking
+        "ref",
+        "referer",
+        "referrer",
+        "source",
+        "campaign",
+        "medium",
+        # Time-based parameters
+        "t",
+        "timestamp",
+        "_t",
+        # Common noise parameters
+        "v",
+        "version",
+        "ver",
+        "cache",
+        "random",
+        "r",
+        "_",
+    }
+)
+
+# Common www removal patterns, compiled once at import
+_WWW_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"^www\d*\.",  # www, www2, www3, etc.
+        r"^m\.",  # mobile versions
+        r"^mobile\.",  # mobile versions
+    )
+)
+
+_DUPLICATE_SLASHES = re.compile(r"/+")
+
+
 class URLCanonicalizer:
     """URL canonicalization utilities for search functionality."""
 
     def __init__(self):
         """Initialize URL canonicalizer with default settings."""
-        # Common URL parameters to remove during canonicalization
-        self.tracking_params = {
-            # Google Analytics and tracking
-            "utm_source",
-            "utm_medium",
-            "utm_campaign",
-            "utm_term",
-            "utm_content",
-            "utm_id",
-            "utm_source_platform",
-            "utm_creative_format",
-            "utm_marketing_tactic",
-            # Facebook tracking
-            "fbclid",
-            "fb_action_ids",
-            "fb_action_types",
-            "fb_ref",
-            "fb_source",
-            # Twitter tracking
-            "ref_src",
-            "ref_url",
-            "twclid",
-            # Other common tracking parameters
-            "gclid",
-            "gclsrc",
-            "dclid",
-            "zanpid",
-            "ranMID",
-            "ranEAID",
-            "ranSiteID",
-            "spm",
-            "_hsenc",
-            "_hsmi",
-            "hsctatracking",
-            "mc_cid",
-            "mc_eid",
-            "pk_campaign",
-            "pk_kwd",
-            "pk_medium",
-            "pk_source",
-            # Session and reference tracking
-            "ref",
-            "referer",
-            "referrer",
-            "source",
-            "campaign",
-            "medium",
-            # Time-based parameters
-            "t",
-            "timestamp",
-            "_t",
-            # Common noise parameters
-            "v",
-            "version",
-            "ver",
-            "cache",
-            "random",
-            "r",
-            "_",
-        }
-
-        # Common www removal patterns
-        self.www_patterns = [
-            r"^www\d*\.",  # www, www2, www3, etc.
-            r"^m\.",  # mobile versions
-            r"^mobile\.",  # mobile versions
-        ]
+        # Shared immutable defaults; nothing here is rebuilt per instance
+        self.tracking_params = _TRACKING_PARAMS
+        self.www_patterns = _WWW_PATTERNS
 
     def canonicalize_url(
         self,
@@ -159,7 +172,7 @@ class URLCanonicalizer:
 
         # Remove www and mobile prefixes
         for pattern in self.www_patterns:
-            domain = re.sub(pattern, "", domain, flags=re.IGNORECASE)
+            domain = pattern.sub("", domain)
 
         return domain
 
@@ -169,7 +182,7 @@ class URLCanonicalizer:
             return "/"
 
         # Remove duplicate slashes
-        path = re.sub(r"/+", "/", path)
+        path = _DUPLICATE_SLASHES.sub("/", path)
 
         # Remove trailing slash for non-root paths
         if len(path) > 1 and path.endswith("/"):
@@ -192,39 +205,27 @@ class URLCanonicalizer:
             # Parse query parameters
             params = parse_qs(query, keep_blank_values=False)
 
-            # Remove tracking parameters if requested
-            if remove_tracking:
-                params = {
-                    key: values
-                    for key, values in params.items()
-                    if key.lower() not in self.tracking_params
-                    and not any(key.lower().startswith(prefix) for prefix in ["utm_"])
-                }
-
-            # Remove empty parameters
-            params = {
-                key: values
-                for key, values in params.items()
-                if values and any(v.strip() for v in values)
-            }
+            tracking_params = self.tracking_params
 
-            if not params:
-                return ""
+            # Flatten to (key, value) pairs in one pass, dropping tracking
+            # parameters and parameters whose values are all empty
+            pairs = (
+                (key, value)
+                for key, values in params.items()
+                if not (
+                    remove_tracking
+                    and (
+                        key.lower() in tracking_params or key.lower().startswith("utm_")
+                    )
+                )
+                and any(v.strip() for v in values)
+                for value in values
+            )
 
-            # Sort parameters if requested
+            # Sorting the pairs orders by key, then by value within a key
             if sort_params:
-                sorted_params = []
-                for key in sorted(params.keys()):
-                    for value in sorted(params[key]):
-                        sorted_params.append((key, value))
-                return urlencode(sorted_params)
-            else:
-                # Maintain original order but clean up
-                clean_params = []
-                for key, values in params.items():
-                    for value in values:
-                        clean_params.append((key, value))
-                return urlencode(clean_params)
+                return urlencode(sorted(pairs))
+            return urlencode(list(pairs))
 
         except Exception:
             # Return original query if parsing fails
@@ -259,31 +260,74 @@ class URLCanonicalizer:
 
     def deduplicate_urls(self, urls: List[str]) -> List[str]:
         """Remove duplicate URLs based on canonical form."""
-        seen_canonical = set()
-        deduplicated = []
+        return _first_per_canonical(urls, [self.canonicalize_url(url) for url in urls])
+
+
+def _first_per_canonical(urls: List[str], canonicals: List[str]) -> List[str]:
+    """Keep the first URL for each canonical form, preserving input order."""
+    seen_canonical = set()
+    deduplicated = []
+
+    for url, canonical in zip(urls, canonicals):
+        if canonical not in seen_canonical:
+            seen_canonical.add(canonical)
+            deduplicated.append(url)
+
+    return deduplicated
+
+
+# Shared canonicalizer for the convenience functions below. It holds no
+# per-call state, so reusing it avoids rebuilding the defaults on every URL.
+_default_canonicalizer = URLCanonicalizer()
 
-        for url in urls:
-            canonical = self.canonicalize_url(url)
-            if canonical not in seen_canonical:
-                seen_canonical.add(canonical)
-                deduplicated.append(url)
 
-        return deduplicated
+@lru_cache(maxsize=131072)
+def _canonicalize_url_cached(url: str, **kwargs) -> str:
+    return _default_canonicalizer.canonicalize_url(url, **kwargs)
 
 
 def canonicalize_url(url: str, **kwargs) -> str:
-    """Convenience function for URL canonicalization."""
-    canonicalizer = URLCanonicalizer()
-    return canonicalizer.canonicalize_url(url, **kwargs)
+    """
+    Convenience function for URL canonicalization.
+
+    Canonicalization is pure, so results for string URLs are memoized per
+    (url, options); repeat URLs from retries and cross-engine duplicates skip
+    parsing. Use canonicalize_url.cache_clear() to reset and cache_info() to
+    inspect.
+    """
+    if not isinstance(url, str):
+        return ""
+    return _canonicalize_url_cached(url, **kwargs)
+
+
+canonicalize_url.cache_clear = _canonicalize_url_cached.cache_clear
+canonicalize_url.cache_info = _canonicalize_url_cached.cache_info
+
+
+def canonicalize_urls(urls: List[str], **kwargs) -> List[str]:
+    """
+    Canonicalize a batch of URLs, preserving input order.
+
+    Each distinct URL in the batch is canonicalized once; bulk callers such
+    as result deduplication should prefer this over a per-URL loop.
+    """
+    canonical_by_url = {}
+    canonicals = []
+    for url in urls:
+        if not isinstance(url, str):
+            canonicals.append("")
+            continue
+        if url not in canonical_by_url:
+            canonical_by_url[url] = canonicalize_url(url, **kwargs)
+        canonicals.append(canonical_by_url[url])
+    return canonicals
 
 
 def extract_domain(url: str) -> str:
     """Convenience function for domain extraction."""
-    canonicalizer = URLCanonicalizer()
-    return canonicalizer.extract_domain(url)
+    return _default_canonicalizer.extract_domain(url)
 
 
 def deduplicate_urls(urls: List[str]) -> List[str]:
     """Convenience function for URL deduplication."""
-    canonicalizer = URLCanonicalizer()
-    return canonicalizer.deduplicate_urls(urls)
+    return _first_per_canonical(urls, canonicalize_urls(urls))
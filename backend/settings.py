@@ -136,3 +136,7 @@ CORS_ALLOWED_HEADERS = [
     "x-csrftoken",
     "x-requested-with",
 ]
+
+# Search adapters
+# Seconds to cache per-engine search results (0, the default, disables the cache)
+SEARCH_RESULT_CACHE_TIMEOUT = int(os.environ.get("SEARCH_RESULT_CACHE_TIMEOUT", "0"))
@@ -5,26 +5,70 @@ Ensures documentation stays in sync with GitHub Project state before commits.
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import re
 import subprocess
 import sys
-import yaml
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# orjson parses large project payloads faster; fall back when the wheel is absent
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# Project board responses are reused between hook runs for this many seconds
+CACHE_TTL_SECONDS = 60
+CACHE_MAX_FILES = 16
+
+# Planning files open with a ```yaml fenced block; only two keys are synced,
+# so those lines are rewritten directly instead of round-tripping YAML
+FRONTMATTER_RE = re.compile(r"\A\s*```yaml\n(.*?)^```", re.DOTALL | re.MULTILINE)
+STATUS_LINE_RE = re.compile(r"^status:.*$", re.MULTILINE)
+LAST_SYNCED_LINE_RE = re.compile(r"^last_synced:.*$", re.MULTILINE)
+
+STORY_ID_RE = re.compile(r"([ST]-\d+)")
+
+
+@lru_cache(maxsize=1024)
+def extract_story_number(title: str) -> Optional[str]:
+    """Extract story/task number from title (S-001, T-001, etc)."""
+    match = STORY_ID_RE.match(title)
+    return match.group(1) if match else None
 
 
 class GitHubProjectToFilesSync:
     """Sync GitHub Project status back to planning files before commits."""
 
-    def __init__(self, repo_name: str, project_number: int, dry_run: bool = False):
+    def __init__(
+        self,
+        repo_name: str,
+        project_number: int,
+        dry_run: bool = False,
+        use_cache: bool = True,
+        runner: Optional[Callable[..., subprocess.CompletedProcess]] = None,
+    ):
         self.repo_name = repo_name
         self.project_number = project_number
         self.dry_run = dry_run
+        self.use_cache = use_cache
+        # Callable with subprocess.run's signature; tests pass an in-process fake
+        self._runner = runner if runner is not None else subprocess.run
+        self.cache_dir = (
+            Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+            / "osint-sync"
+        )
         self.project_root = Path.cwd()
         self.stories_dir = self.project_root / "planning" / "stories"
         self.tasks_dir = self.project_root / "planning" / "tasks"
+        self._planning_index: Optional[Dict[str, Path]] = None
 
         # GitHub Project status mapping to file status
         self.status_mapping = {
@@ -46,7 +90,7 @@ class GitHubProjectToFilesSync:
             # Use subprocess.run with environment variable handling
             env = os.environ.copy()
             env.pop("GH_TOKEN", None)  # Remove GH_TOKEN from environment
-            result = subprocess.run(
+            result = self._runner(
                 ["gh"] + cmd_args, capture_output=True, text=True, check=True, env=env
             )
             return result.stdout.strip()
@@ -56,6 +100,43 @@ class GitHubProjectToFilesSync:
             print(f"   Error: {e.stderr}")
             return None
 
+    def _cache_path(self) -> Path:
+        """Cache file for this repository owner's project board."""
+        owner = self.repo_name.split("/")[0]
+        return self.cache_dir / f"project-{owner}-{self.project_number}.json"
+
+    def _read_cached_response(self) -> Optional[str]:
+        """Return the cached API response if it is younger than the TTL."""
+        if not self.use_cache:
+            return None
+
+        cache_path = self._cache_path()
+        try:
+            if time.time() - cache_path.stat().st_mtime > CACHE_TTL_SECONDS:
+                return None
+            return cache_path.read_text()
+        except OSError:
+            return None
+
+    def _write_cached_response(self, response: str) -> None:
+        """Store an API response and evict the oldest cache files."""
+        if not self.use_cache:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._cache_path().write_text(response)
+
+            cached = sorted(
+                self.cache_dir.glob("project-*.json"),
+                key=lambda path: path.stat().st_mtime,
+                reverse=True,
+            )
+            for stale in cached[CACHE_MAX_FILES:]:
+                stale.unlink()
+        except OSError as e:
+            print(f"⚠️  Could not write GitHub Project cache: {e}")
+
     def _get_project_items_with_status(self) -> List[Dict]:
         """Get all project items with their current status from GitHub."""
         print("🔄 Fetching GitHub Project status...")
@@ -118,12 +199,17 @@ class GitHubProjectToFilesSync:
             f'number={variables["number"]}',
         ]
 
-        result = self._run_gh_command(cmd)
-        if not result:
-            return []
+        result = self._read_cached_response()
+        if result:
+            print("   Using cached GitHub Project status")
+        else:
+            result = self._run_gh_command(cmd)
+            if not result:
+                return []
+            self._write_cached_response(result)
 
         try:
-            data = json.loads(result)
+            data = json_loads(result)
             items = data["data"]["user"]["projectV2"]["items"]["nodes"]
 
             processed_items = []
@@ -160,93 +246,145 @@ class GitHubProjectToFilesSync:
 
     def _extract_story_number(self, title: str) -> Optional[str]:
         """Extract story/task number from title (S-001, T-001, etc)."""
-        match = re.match(r"([ST]-\d+)", title)
-        return match.group(1) if match else None
+        return extract_story_number(title)
+
+    def _item_ids_from_filenames(self, filenames: Iterable[str]) -> Set[str]:
+        """Collect story/task IDs from planning file paths (S-001-*.md, etc)."""
+        item_ids = set()
+        for filename in filenames:
+            item_id = self._extract_story_number(Path(filename).name)
+            if item_id:
+                item_ids.add(item_id)
+        return item_ids
+
+    def _build_planning_index(self) -> Dict[str, Path]:
+        """Map story/task IDs to planning files with one scan per directory."""
+        index = {}
+        for directory, prefix in ((self.stories_dir, "S-"), (self.tasks_dir, "T-")):
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            for entry in entries:
+                # Files follow the pattern S-001-*.md / T-001-*.md
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                item_id = self._extract_story_number(entry.name)
+                if (
+                    item_id
+                    and item_id.startswith(prefix)
+                    and entry.name[len(item_id) : len(item_id) + 1] == "-"
+                ):
+                    index.setdefault(item_id, Path(entry.path))
+        return index
 
     def _find_planning_file(self, item_id: str) -> Optional[Path]:
         """Find the corresponding planning file for a story/task ID."""
-        if item_id.startswith("S-"):
-            # Look for files matching the pattern S-001-*
-            pattern = f"{item_id}-*.md"
-            matches = list(self.stories_dir.glob(pattern))
-            return matches[0] if matches else None
-        elif item_id.startswith("T-"):
-            # Look for files matching the pattern T-001-*
-            pattern = f"{item_id}-*.md"
-            matches = list(self.tasks_dir.glob(pattern))
-            return matches[0] if matches else None
-        return None
-
-    def _update_file_status(self, file_path: Path, new_status: str) -> bool:
-        """Update status in planning file YAML frontmatter."""
+        if self._planning_index is None:
+            self._planning_index = self._build_planning_index()
+        return self._planning_index.get(item_id)
+
+    def _update_file_status(
+        self, file_path: Path, new_status: str, timestamp: Optional[str] = None
+    ) -> Optional[bool]:
+        """Update status in planning file YAML frontmatter.
+
+        Returns True when the file was updated, None when it already had the
+        status (the file is left untouched so its mtime does not change) and
+        False on error.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+
         if not file_path.exists():
             print(f"⚠️  File not found: {file_path}")
             return False
 
         try:
             content = file_path.read_text()
+            status_line = f"status: {new_status}"
+            synced_line = f"last_synced: '{timestamp}'"
 
             # Check if file has YAML frontmatter
             if content.strip().startswith("```yaml"):
-                lines = content.split("\n")
-                yaml_end = -1
-
-                # Find end of YAML block
-                for i, line in enumerate(lines[1:], 1):
-                    if line.strip() == "```":
-                        yaml_end = i
-                        break
-
-                if yaml_end > 0:
-                    # Parse existing YAML
-                    yaml_content = "\n".join(lines[1:yaml_end])
-                    try:
-                        metadata = yaml.safe_load(yaml_content) or {}
-                    except yaml.YAMLError:
-                        metadata = {}
-
-                    # Update status
-                    metadata["status"] = new_status
-                    metadata["last_synced"] = self._get_current_timestamp()
-
-                    # Reconstruct file
-                    new_yaml = yaml.dump(metadata, default_flow_style=False)
-                    remaining_content = "\n".join(lines[yaml_end + 1 :])
-                    new_content = f"```yaml\n{new_yaml}```\n{remaining_content}"
-
-                    if not self.dry_run:
-                        file_path.write_text(new_content)
-
-                    return True
+                match = FRONTMATTER_RE.match(content)
+                if not match:
+                    return False
+
+                # Leave files that already carry this status untouched
+                frontmatter = match.group(1)
+                current = STATUS_LINE_RE.search(frontmatter)
+                if current and current.group(0).rstrip() == status_line:
+                    return None
+
+                # Rewrite just the status and last_synced lines in place
+                frontmatter, found = STATUS_LINE_RE.subn(
+                    status_line, frontmatter, count=1
+                )
+                if not found:
+                    frontmatter += f"{status_line}\n"
+                frontmatter, found = LAST_SYNCED_LINE_RE.subn(
+                    synced_line, frontmatter, count=1
+                )
+                if not found:
+                    frontmatter += f"{synced_line}\n"
+
+                new_content = (
+                    content[: match.start(1)] + frontmatter + content[match.end(1) :]
+                )
             else:
                 # Add YAML frontmatter if it doesn't exist
-                metadata = {
-                    "status": new_status,
-                    "last_synced": self._get_current_timestamp(),
-                }
+                new_content = f"```yaml\n{status_line}\n{synced_line}\n```\n\n{content}"
 
-                yaml_str = yaml.dump(metadata, default_flow_style=False)
-                new_content = f"```yaml\n{yaml_str}```\n\n{content}"
+            if new_content == content:
+                return None
 
-                if not self.dry_run:
-                    file_path.write_text(new_content)
+            if not self.dry_run:
+                file_path.write_text(new_content)
 
-                return True
+            return True
 
         except Exception as e:
             print(f"❌ Error updating {file_path}: {e}")
             return False
 
-        return False
-
     def _get_current_timestamp(self) -> str:
         """Get current timestamp in ISO format."""
         from datetime import datetime
 
         return datetime.now().isoformat()
 
-    def sync_status_to_files(self) -> Tuple[int, int]:
-        """Sync GitHub Project status back to planning files."""
+    def _update_one(self, item: Dict, timestamp: str) -> Optional[bool]:
+        """Update the planning file for one project item.
+
+        Returns None when the item has no matching planning file or is already
+        in sync, otherwise whether the update succeeded.
+        """
+        title = item.get("title", "")
+        status = item.get("status", "todo")
+
+        # Extract story/task ID from title
+        item_id = self._extract_story_number(title)
+        if not item_id:
+            return None
+
+        # Find corresponding planning file
+        file_path = self._find_planning_file(item_id)
+        if not file_path:
+            return None
+
+        print(f"  📝 Updating {item_id}: {status}")
+
+        return self._update_file_status(file_path, status, timestamp)
+
+    def sync_status_to_files(
+        self, item_ids: Optional[Set[str]] = None
+    ) -> Tuple[int, int]:
+        """Sync GitHub Project status back to planning files.
+
+        If item_ids is given, only items with those story/task IDs are updated.
+        """
         print("🔄 Syncing GitHub Project status to planning files...")
 
         # Get project items with status
@@ -255,41 +393,85 @@ class GitHubProjectToFilesSync:
             print("❌ No project items found or error fetching data")
             return 0, 0
 
-        updated = 0
-        errors = 0
+        if item_ids is not None:
+            project_items = [
+                item
+                for item in project_items
+                if self._extract_story_number(item.get("title", "")) in item_ids
+            ]
+            if not project_items:
+                return 0, 0
+
+        # One timestamp for the whole run so every file records the same sync
+        timestamp = self._get_current_timestamp()
+
+        # Index planning files up front; worker threads only read it
+        self._planning_index = self._build_planning_index()
+
+        # Each file update is independent I/O, so run them concurrently
+        max_workers = min(32, len(project_items))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
+            results = list(
+                ex.map(lambda item: self._update_one(item, timestamp), project_items)
+            )
+
+        updated = sum(1 for result in results if result is True)
+        errors = sum(1 for result in results if result is False)
+
+        return updated, errors
+
+    def check_frontmatter(self, filenames: List[str]) -> int:
+        """Validate planning file frontmatter locally, without calling GitHub.
 
-        for item in project_items:
-            title = item.get("title", "")
-            status = item.get("status", "todo")
+        Flags files whose ```yaml block is never closed or has no status line,
+        which the sync would otherwise fail on at push time.
+        """
+        problems = 0
+        for filename in filenames:
+            file_path = Path(filename)
+            if not self._extract_story_number(file_path.name):
+                continue
 
-            # Extract story/task ID from title
-            item_id = self._extract_story_number(title)
-            if not item_id:
+            try:
+                content = file_path.read_text()
+            except OSError as e:
+                print(f"❌ Could not read {file_path}: {e}")
+                problems += 1
                 continue
 
-            # Find corresponding planning file
-            file_path = self._find_planning_file(item_id)
-            if not file_path:
+            if not content.strip().startswith("```yaml"):
                 continue
 
-            print(f"  📝 Updating {item_id}: {status}")
+            match = FRONTMATTER_RE.match(content)
+            if not match:
+                print(f"❌ {file_path}: unterminated ```yaml frontmatter block")
+                problems += 1
+            elif not STATUS_LINE_RE.search(match.group(1)):
+                print(f"❌ {file_path}: frontmatter has no status line")
+                problems += 1
 
-            if self._update_file_status(file_path, status):
-                updated += 1
-            else:
-                errors += 1
+        return 1 if problems else 0
 
-        return updated, errors
+    def run_sync(self, filenames: Optional[List[str]] = None):
+        """Run the complete sync process.
 
-    def run_sync(self):
-        """Run the complete sync process."""
+        When pre-commit passes filenames, only the matching stories and tasks
+        are synced; with none, every planning file is considered.
+        """
         print(f"🔄 GitHub Project → Files Sync")
         print(f"   Repository: {self.repo_name}")
         print(f"   Project: #{self.project_number}")
         print(f"   Dry run: {self.dry_run}")
         print()
 
-        updated, errors = self.sync_status_to_files()
+        item_ids = None
+        if filenames:
+            item_ids = self._item_ids_from_filenames(filenames)
+            if not item_ids:
+                print("ℹ️  No story or task files changed - nothing to sync")
+                return 0
+
+        updated, errors = self.sync_status_to_files(item_ids)
 
         print()
         print("📊 Sync Summary:")
@@ -308,11 +490,16 @@ class GitHubProjectToFilesSync:
         return 0
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Sync GitHub Project status to planning files"
     )
     parser.add_argument("repo", help="Repository name (owner/repo)")
+    parser.add_argument(
+        "filenames",
+        nargs="*",
+        help="Planning files to sync (as passed by pre-commit); defaults to all",
+    )
     parser.add_argument(
         "--project-number", type=int, required=True, help="GitHub Project number"
     )
@@ -321,11 +508,26 @@ def main():
         action="store_true",
         help="Show what would be done without making changes",
     )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only validate planning file frontmatter; no GitHub access",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch project status from GitHub (e.g. in CI)",
+    )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    syncer = GitHubProjectToFilesSync(args.repo, args.project_number, args.dry_run)
-    exit_code = syncer.run_sync()
+    syncer = GitHubProjectToFilesSync(
+        args.repo, args.project_number, args.dry_run, use_cache=not args.no_cache
+    )
+    if args.check:
+        exit_code = syncer.check_frontmatter(args.filenames)
+    else:
+        exit_code = syncer.run_sync(args.filenames)
     sys.exit(exit_code)
 
 
@@ -13,7 +13,9 @@ import sys
 from pathlib import Path
 
 # Add scripts to path for importing
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+scripts_path = str(Path(__file__).parent.parent / "scripts")
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
 
 from add_acceptance_checkboxes import (
     create_acceptance_checklist,
@@ -10,7 +10,8 @@ from pathlib import Path
 # Add scripts directory to path
 project_root = Path(__file__).parent.parent
 scripts_dir = project_root / "scripts"
-sys.path.insert(0, str(scripts_dir))
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
 
 import importlib.util
 
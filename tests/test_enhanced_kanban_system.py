@@ -14,7 +14,8 @@ from pathlib import Path
 
 # Add scripts to path for importing
 scripts_path = Path(__file__).parent.parent / "scripts"
-sys.path.insert(0, str(scripts_path))
+if str(scripts_path) not in sys.path:
+    sys.path.insert(0, str(scripts_path))
 
 # Import the kanban system from scripts directory
 import importlib.util
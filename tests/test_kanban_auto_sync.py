@@ -13,11 +13,10 @@ import importlib.util
 
 # Add scripts to path for importing
 scripts_path = Path(__file__).parent.parent / "scripts"
-sys.path.insert(0, str(scripts_path))
+if str(scripts_path) not in sys.path:
+    sys.path.insert(0, str(scripts_path))
 
 # Import the kanban auto-sync from scripts directory
-import importlib.util
-
 kanban_script = scripts_path / "kanban-auto-sync.py"
 spec = importlib.util.spec_from_file_location("kanban_auto_sync", kanban_script)
 kanban_auto_sync = importlib.util.module_from_spec(spec)
@@ -15,7 +15,9 @@ from unittest.mock import Mock, patch, MagicMock
 import sys
 
 # Add scripts to path for importing
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+scripts_path = str(Path(__file__).parent.parent / "scripts")
+if scripts_path not in sys.path:
+    sys.path.insert(0, scripts_path)
 
 from milestone_automation import MilestoneAutomation
 